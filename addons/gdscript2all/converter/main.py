@@ -10,11 +10,18 @@ def main():
 	commandLineArgs.add_argument('-o', '--output', nargs = '?', default = './results', help='where to output transpiled code ')
 	commandLineArgs.add_argument('-t', '--transpiler', nargs = '?', default = 'CSharp', help='which transpiler script to use')
 	commandLineArgs.add_argument('-v', '--verbose', action='store_true', default = False, help='print additional execution logs' )
+	commandLineArgs.add_argument('--cache_node_paths', action='store_true', default = False, help='store $node/%%node lookups in fields assigned on ready' )
 	commandLineArgs.add_argument('--use_floats', action='store_true', default = False, help='leave floating point types as floats' )
+	commandLineArgs.add_argument('--fold_constants', action='store_true', default = False, help='evaluate constant arithmetic and build constant value types once' )
+	commandLineArgs.add_argument('--use_lists', action='store_true', default = False, help='use List for typed arrays that stay in their method (C#)' )
+	commandLineArgs.add_argument('--use_packed_arrays', action='store_true', default = False, help='use packed arrays for typed arrays of numbers, strings, vectors and colors that stay in their method (C++)' )
+	commandLineArgs.add_argument('--unity_build', action='store_true', default = False, help='also generate a unity build cpp including every generated cpp, and a shared header to precompile (C++)' )
+	commandLineArgs.add_argument('--hoist_invariants', action='store_true', default = False, help='cache singletons used in loops into locals declared before them (C++)' )
 	commandLineArgs.add_argument('--transpiler_verbose', action='store_true', default = False, help='print additional parser execution logs' )
 	commandLineArgs.add_argument('--parser_verbose', action='store_true', default = False, help='print additional transpiler execution logs' )
 	commandLineArgs.add_argument('--no_type_resolving', action='store_true', default = False, help='removes the initial type resolving step for user types' )
 	commandLineArgs.add_argument('--no_save', action='store_true', default = False, help='do not save output code as a file' )
+	commandLineArgs.add_argument('--stream_output', action='store_true', default = False, help='write output code while transpiling, lowers memory use for huge scripts' )
 	commandLineArgs.add_argument('--print_tokens', action='store_true', default = False, help='print the tokenizer output' )
 	commandLineArgs.add_argument('--log_file', default = '', help='redirect stdout and stderr to specified filepath' )
 	commandLineArgs.add_argument('--create_gdextension', default = '', help='creates a gdextension cpp project in the output dir with specified name' )
@@ -29,6 +36,13 @@ def main():
 	# dynamic import
 	Transpiler = __import__(args.transpiler.replace('.py', ''))
 	Transpiler.use_floats = args.use_floats
+	Transpiler.use_lists = args.use_lists
+	Transpiler.loop_hoisting = args.hoist_invariants
+	Transpiler.use_packed_arrays = args.use_packed_arrays
+	Transpiler.unity_build = args.unity_build
+	Transpiler.stream_output = args.stream_output and not args.no_save
+	Parser.cache_node_paths = args.cache_node_paths
+	Parser.fold_constants = args.fold_constants
 
 	# for verbose printing
 	def getPrinter(condition): return print if condition else lambda a,*b:None
@@ -68,10 +82,13 @@ def main():
 	script_classes = {}
 	failed = False
 	if not args.no_type_resolving:
+		# NOTE: parser is reused for every file
+		parser = Parser.Parser('', '', TypeResolver(), lambda a,*b:None )
 		for i, filename in enumerate(input_files):
 			try:
 				with open(filename,'r+') as f: text = f.read()
-				parser = Parser.Parser(to_script_name(filename), text, TypeResolver(), lambda a,*b:None )
+				parser.out.reset()
+				parser.reset(to_script_name(filename), text)
 				parser.transpile()
 				script_classes[parser.getClassName()] = parser.getClass()
 				
@@ -83,12 +100,19 @@ def main():
 
 		# we add the deduced types the parser class,
 		# they'll be available in the actual transpiling step
-		Parser.godot_types.update(script_classes)
+		Parser.add_types(script_classes)
+		
+		# methods not overridden by a user class are dispatched statically
+		Parser.build_override_table()
 
 	# generate the cpp project if specified
 	if project_name := args.create_gdextension:
 		generate_project(args.output, project_name, script_classes.keys())
 
+	# NOTE: transpiler and parser are reused for every file
+	transpiler = Transpiler.Transpiler('', '', getPrinter(args.verbose or args.transpiler_verbose) )
+	parser = Parser.Parser('', '', transpiler, getPrinter(args.verbose or args.parser_verbose) )
+
 	for i, filename in enumerate(input_files):
 		try:
 			
@@ -99,8 +123,8 @@ def main():
 			with open(filename,'r+') as f: text = f.read()
 			
 			script_name = to_script_name(filename)
-			transpiler = Transpiler.Transpiler(script_name, outname, getPrinter(args.verbose or args.transpiler_verbose) )
-			parser = Parser.Parser(script_name, text, transpiler, getPrinter(args.verbose or args.parser_verbose) )
+			transpiler.reset(script_name, outname)
+			parser.reset(script_name, text)
 			
 			if args.print_tokens:
 				print('\n'.join(map(lambda token: f'line {token.lineno}: {token.type} <{token.value}>', parser.tokenizer.tokenize(text))))
@@ -115,6 +139,9 @@ def main():
 
 		print(f"Converted {to_simple_path(filename)} to {to_simple_path(outname)} ({i+1}/{total})")
 
+	if not args.no_save:
+		transpiler.save_project(args.output)
+
 
 def handleException(parser, ex):
 		print('parser fail on', parser.current)
@@ -1,17 +1,32 @@
-from re import sub as regex_replace
+import re as regex
+from functools import lru_cache
 from godot_types import *
 
 from StringBuilder import StringBuilder
+from OutputStream import OutputStream
+
+# use System.Collections.Generic.List for typed arrays that never leave their method (set by main.py)
+use_lists = False
+
+# write code to the output file while transpiling (set by main.py)
+# useful for huge scripts, since memory use then scales with the biggest method
+stream_output = False
 
 class Transpiler:
 	
 	def __init__(self, script_name, out_name, vprint):
 		
-		self.out_name = out_name
-		
 		# verbose printing
 		self.vprint = vprint
 		
+		self.reset(script_name, out_name)
+	
+	# prepare the transpiler for another script
+	# NOTE: allows to reuse a transpiler for batches of files
+	def reset(self, script_name, out_name):
+		
+		self.out_name = out_name
+		
 		# scope level
 		self.level = 0
 		
@@ -23,8 +38,17 @@ class Transpiler:
 		# unnamed enums don't exist in C#, so we use a counter to give them a name
 		self.unnamed_enums = 0
 		
+		# lambdas stored in static fields, emitted before the method using them
+		# (field_name, delegate_type, level, code)
+		self.lambda_fields = []
+		self.lambda_count = 0
+		
+		# property whose accessors are being generated
+		# references to it are emitted as its private backing field
+		self.accessed_property = None
+		
 		# allows to parse code and rearrange it
-		self.layers = [StringBuilder()]
+		self.layers = [OutputStream() if stream_output else StringBuilder()]
 		
 		# result cs
 		self.cs = ''
@@ -51,7 +75,8 @@ class Transpiler:
 		def_ = ''
 		for i, (pName, pType) in enumerate(params.items()):
 				if i != 0: def_ += ', '
-				def_ += pName
+				# NOTE: values of named enums are referenced as constants
+				def_ += constantName(pName) if name else pName
 				if pName in params_init:
 					self.addLayer(); get(params_init[pName])
 					def_ += ' = ' + self.popLayer()
@@ -88,6 +113,11 @@ class Transpiler:
 
 		# setget
 		if accessors:
+			# add private property if missing
+			private_version = toPrivate(name)
+			add_private = not private_version in self.klass.members
+			if add_private: self.accessed_property = name
+			
 			self.addLayer()
 
 			self.UpScope()
@@ -114,9 +144,7 @@ class Transpiler:
 			
 			code = self.popLayer()
 			
-			# add private property if missing)
-			private_version = toPrivate(name)
-			if not private_version in self.klass.members:
+			if add_private:
 				privateMember = '}\n' + '\t' * self.level + \
 					f'private {translate_type(type)} {toPascal(private_version)}'
 				if assignment_str: privateMember += assignment_str
@@ -125,13 +153,15 @@ class Transpiler:
 
 			# add missing getters / setters
 			if not set_defined or not get_defined:
+				field = self.propertyName(name)
 				self.addLayer()
 				if set_defined:
-					self.getter(name, f' {{ return {pascalName}; }}'); self += '\n'
+					self.getter(name, f' {{ return {field}; }}'); self += '\n'
 				else:
-					self.setter(name, 'value', f' {{ {pascalName} = value; }}'); self += '\n'
+					self.setter(name, 'value', f' {{ {field} = value; }}'); self += '\n'
 				code = replaceClosingBrace(code, f'\t{self.popLayer()}}}')
 
+			self.accessed_property = None
 			self.write(code)
 		
 		
@@ -144,34 +174,47 @@ class Transpiler:
 		self += f'set => {setterName}(value);\n'
 	
 	def getter(self, member, code):
-		self += 'get';
-		code = self.cleanGetSetCode(code, member)
+		self += 'get'
 		self.write(code)
 	
 	def setter(self, member, valueName, code):
-		self += 'set';
-		code = self.cleanGetSetCode(code, member)
+		self += 'set'
 		self.write(code.replace(valueName, 'value'))
 	
-	def cleanGetSetCode(self, code, member):
-		# use private value instead of property name
-		if not toPrivate(member) in self.klass.members:
-			# using capture groups to keep non-word characters (that delimit name)
-			code = regex_replace(fr'(\W){toPascal(member)}(\W)', fr'\1{toPrivate(toPascal(member))}\2', code)
-		return code
+	# value built once for the class
+	def declare_constant(self, type, name, value):
+		self += f'private static readonly {translate_type(type)} {toPascal(name)} = '; get(value); self += ';\n'
 	
 	def declare_variable(self, type, name, assignment):
-		self += f'var {name}'
+		# NOTE: var needs a value to infer the type from
+		self += f'var {name}' if assignment else f'{translate_type(type)} {name}'
 		if assignment: self.assignment(assignment)
 	
-	def define_method(self, name, params = {}, params_init = {}, return_type = None, code = '', static = False, override = False):
+	# typed array that stays in its method, var takes the type of its create_list value
+	def declare_list(self, type, name, assignment):
+		self.declare_variable(type, name, assignment)
+	
+	# locals declared as Variant but always assigned the same type
+	def narrow_locals(self, code, narrowed):
+		for name, type in narrowed.items():
+			code = regex.sub(rf'\b{translate_type("Variant")} {name};', f'{translate_type(type)} {name};', code)
+		return code
+	
+	def define_method(self, name, params = {}, params_init = {}, return_type = None, code = '', static = False, override = False, virtual = False):
 		
 		if not code:
 			self.addLayer(); self += '\n{\n}'; code = self.popLayer()
 		
-		exposed = 'protected' if name[0] == '_' and not override else 'public'
+		# fields for the lambdas cached by the method
+		for field, delegate, level, lambda_code in self.lambda_fields:
+			lambda_code = lambda_code.replace('\n' + '\t' * (level - self.level), '\n')
+			self += f'private static readonly {delegate} {field} = '; self.write(lambda_code); self += ';\n\n'
+		self.lambda_fields.clear()
+		
+		# NOTE: overrides are public, so the methods they override must be too
+		exposed = 'protected' if name[0] == '_' and not (override or virtual) else 'public'
 		static_str = 'static ' if static else ''
-		override_str = 'override ' if override else ''
+		override_str = 'override ' if override else 'virtual ' if virtual else ''
 		self += f'{exposed} {override_str}{static_str}{translate_type(return_type)} {toPascal(name)}('
 		
 		for i, (pName, pType) in enumerate(params.items()):
@@ -203,23 +246,69 @@ class Transpiler:
 	def subexpression(self, expression):
 		self += '('; get(expression); self += ')'
 	
-	def create_array(self, values):
-		self += 'new Array{'
+	def create_array(self, values, type = None):
+		self += f'new {translate_type(type or "Array")}{{'
 		self += values
 		self += '}'
 
+	# typed array that stays in its method
+	def create_list(self, values, type):
+		if not use_lists: self.create_array(values, type); return
+		self += f'new System.Collections.Generic.List<{translate_type(type[:-2])}>{{'
+		self += values
+		self += '}'
+	
+	# interpolated string, with gdscript specifiers converted to format strings
+	def string_format(self, format, values):
+		specifiers = FORMAT_SPECIFIER.findall(format)
+		holes = [ spec for spec in specifiers if spec[-1] != '%' ]
+		
+		# no C# equivalent for dynamic width/precision (*)
+		if len(holes) != len(values) or any( '*' in spec for spec in holes ):
+			self.addLayer()
+			for value in values: self.array_item(value)
+			contents = self.popLayer()
+			self.addLayer(); self.create_array(contents); array = self.popLayer()
+			self.unformatted(format, array, 'no C# equivalent to these specifiers')
+			return
+		
+		self += '$"'
+		values = iter(values)
+		for text, spec in zip(FORMAT_SPECIFIER.split(format), [*specifiers, None]):
+			self.write(text.replace('{', '{{').replace('}', '}}').replace('"', '\\"').replace('\n', '\\n'))
+			if spec == None: break
+			if spec == '%%': self.write('%'); continue
+			self.addLayer(); get(next(values)); value = self.popLayer()
+			# ternaries or casts would be read as alignment or format
+			if regex.search(r'[?:,]', value): value = f'({value})'
+			self.write(f'{{{toFormatItem(value, spec)}}}')
+		self += '"'
+	
+	# NOTE: values only known at runtime can't be interpolated
+	def string_format_array(self, format, array):
+		self.addLayer(); get(array); array = self.popLayer()
+		self.unformatted(format, array, 'no C# equivalent to formatting with an array')
+	
+	# the format string left as-is, with what it should have been formatted with
+	def unformatted(self, format, values, reason):
+		self.string(format); self += f' /* % {values} : {reason} */'
+	
 	def array_item(self, item):
 		get(item); self += ', '
 		
-	def create_dict(self, values):
-		self += 'new Dictionary{'
+	def create_dict(self, values, type = None):
+		self += f'new {translate_type(type or "Dictionary")}{{'
 		self += values
 		self += '}'
 
 	def dict_item(self, key, value):
 		self += '{'; get(key); self += ', '; get(value); self += '},'
 	
-	def create_lambda(self, params, code):
+	def create_lambda(self, params, code, return_type, captures, in_method):
+		# lambdas capturing nothing are stored once instead of allocated at every evaluation
+		cached = in_method and not captures
+		if cached: self.addLayer()
+		
 		self += '('
 		for i, (pName, pType) in enumerate(params.items()):
 			if i != 0: self += ', '
@@ -227,8 +316,19 @@ class Transpiler:
 		self += ') =>'
 		# cleanup
 		code = code.replace('{', '{\t', 1)
-		code = replaceClosingBrace(code, '};')
-		self.write(code)
+		if not cached:
+			self.write(replaceClosingBrace(code, '};'))
+			return
+		
+		# whitespace and comments following the body stay in place
+		# NOTE: ends the statement like the uncached closing brace
+		body_end = replaceClosingBrace(code, '\0').index('\0') + 1
+		self.write(code[:body_end])
+		
+		name = f'_Lambda{self.lambda_count}'
+		self.lambda_count += 1
+		self.lambda_fields.append((name, toDelegateType(params, return_type), self.level, self.popLayer()))
+		self.write(name + ';' + code[body_end:])
 	
 	def literal(self, value):
 		if isinstance(value, bool):
@@ -244,10 +344,13 @@ class Transpiler:
 		self.write(value)
 	
 	def constant(self, name):
-		self += '.' + (name if not name.isupper() else toPascal(name.lower()) )
+		self += '.' + constantName(name)
 	
 	def property(self, name):
-		self += toPascal(name)
+		self += self.propertyName(name)
+	
+	def propertyName(self, name):
+		return toPascal(toPrivate(name) if name == self.accessed_property else name)
 	
 	def variable(self, name):
 		self += variable_replacements.get(name, name)
@@ -265,9 +368,12 @@ class Transpiler:
 		if calling_type == GLOBALS: name = function_replacements.get(name, name)
 		
 		# for some reason, API diverges here
-		elif name == 'has':
-			name = ('Contains' if calling_type == 'Array'
-				else 'ContainsKey' if calling_type == 'Dictionary'
+		# NOTE: the names used for arrays are shared with lists
+		elif isArrayType(calling_type) or isDictionaryType(calling_type):
+			if name == 'size': self += 'Count'; return
+			name = ('Contains' if name == 'has' and isArrayType(calling_type)
+				else 'ContainsKey' if name == 'has'
+				else 'Add' if name in ('append', 'push_back') and isArrayType(calling_type)
 				else name )
 
 		self += toPascal(name) + '('
@@ -290,6 +396,12 @@ class Transpiler:
 		if op == '!': self += op
 		else: self += f' {op} '
 	
+	def cast(self, exp, type, cast):
+		self.addLayer(); get(exp); code = self.popLayer()
+		if not regex.fullmatch(r'[\w.]+', code): code = f'({code})'
+		if type in (None, 'Variant'): self += f'{code}.As<{translate_type(cast)}>()'
+		else: self += f'{code} as {translate_type(cast)}'
+	
 	def check_type(self, exp, checked):
 		get(exp); self += f' is {translate_type(checked)}'
 
@@ -316,59 +428,121 @@ class Transpiler:
 	def forStmt(self, name, type, exp):
 		self += f'foreach({type} {name} in '; get(exp); self += ')'
 	
+	# range(end) / range(start, end) / range(start, end, step)
+	# NOTE: avoids the array allocated by GD.Range
+	def forRangeStmt(self, name, type, params):
+		args = []
+		for p in params:
+			self.addLayer(); get(p); args.append(self.popLayer())
+		if len(args) == 1: args.insert(0, '0')
+		start, end, step = (*args, '1')[:3]
+		
+		# range() is evaluated once, so are the bounds
+		declarations = f'{name} = {start}'
+		if needsEvaluation(end): declarations += f', {name}_end = {end}'; end = f'{name}_end'
+		if needsEvaluation(step): declarations += f', {name}_step = {step}'; step = f'{name}_step'
+		
+		# direction is only known at runtime for non-literal steps
+		step_value = intLiteral(step)
+		if step_value == None:
+			condition = f'({step} > 0 ? {name} < {end} : {name} > {end})'
+			increment = f'{name} += {step}'
+		elif step_value < 0:
+			condition = f'{name} > {end}'
+			increment = f'{name} -= {-step_value}'
+		else:
+			condition = f'{name} < {end}'
+			increment = f'{name} += {step_value}'
+		
+		self += f'for({translate_type(type)} {declarations}; {condition}; {increment})'
+	
+	# nothing to gain, C# singletons are static classes and properties are inlined
+	def hoist_invariants(self, code): return code
+	
 	def breakStmt(self): self += 'break;'
 	
 	def continueStmt(self): self += 'continue;'
 	
-	def awaitStmt(self, object, signalName):
+	def awaitStmt(self, object, signalName, owner):
 		object = 'this' if object == 'self' else object
-		self += f'await ToSignal({object}, "{toPascal(signalName)}");'
+		self += f'await ToSignal({object}, {self.signalName(signalName, owner)});'
 	
-	def emitSignal(self, signalName, params):
-		self += f'EmitSignal("{toPascal(signalName)}"'
+	def emitSignal(self, signalName, params, owner):
+		self += f'EmitSignal({self.signalName(signalName, owner)}'
 		for i, p in enumerate(params):
 			self += ', '
 			get(p)
 		self += ')'
 	
+	# typed arrays that are only used in the method (declared from a literal)
+	def getNode(self, path, type):
+		self += f'GetNode<{translate_type(type)}>(' if type != 'Node' else 'GetNode('
+		self.string(path); self += ')'
+	
 	def connectSignal(self, signalName, params):
 		self += f'{toPascal(signalName)} += '; get(params[0])
 	
+	# SignalName members are StringNames generated by Godot
+	# so they avoid converting a string at every call
+	def signalName(self, name, owner):
+		if owner == self.class_name: return f'SignalName.{toPascal(name)}'
+		if owner: return f'{owner}.SignalName.{toPascal(name)}'
+		return f'"{toPascal(name)}"'
+	
 	def matchStmt(self, evaluated, cases):
 		type = get(evaluated)
 		
-		# use switch on literals
-		if type in ('int', 'string', 'float'):
+		# use switch on literals and enums
+		if type in ('int', 'string', 'float') or type and type.endswith('enum'):
 			
 			self += 'switch('; get(evaluated); self += ')'
 			self.UpScope()
 			
+			# NOTE: cases after the default one are unreachable in gdscript,
+			# only the scopes they close are kept
+			default = None
 			for pattern, when, code in cases():
+				if default != None: default = default.rstrip() + afterBlock(code); continue
 				if pattern == 'default':
 					self += 'default:'
 				else:
 					self += 'case '; get(pattern); self += ':'
 					if when: self += ' if('; get(when); self += ')'
 				code = replaceClosingBrace(code, '\tbreak; }')
-				self.write(code)
+				if pattern == 'default': default = code
+				else: self.write(code)
+			if default != None: self.write(default)
 		
-		 # default to if else chains for objects
+		# default to if else chains for objects
+		# NOTE: the value is evaluated once, as it may have side effects
+		# the scope keeps its temporary local to the match
 		else:
-			self.addLayer()
-			self += 'if('
-			get(evaluated)
-			self += ' == '
-			comparison = self.popLayer()
+			self.addLayer(); get(evaluated); value = self.popLayer()
+			# NOTE: the scope opens at the statement position, closed by the parser like other blocks
+			self += '{'
+			self.level += 1
+			# NOTE: suffixed by the level for nested matches
+			if not value.replace('.', '_').isidentifier():
+				temp = f'_match{self.level}'
+				self += f'\nvar {temp} = {value};'
+				value = temp
 			
-			for pattern, when, code in cases():
+			# a default case ends the chain, or is the only block if first
+			# NOTE: cases after the default one are unreachable in gdscript,
+			# only the scopes they close are kept
+			default = None
+			for i, (pattern, when, code) in enumerate(cases()):
+				if default != None: default = default.rstrip() + afterBlock(code); continue
 				if pattern == 'default':
-					self += 'else '
+					if i > 0: self += 'else '
+					default = code if i > 0 else code.lstrip()
 				else:
-					self.write(comparison)
+					self += f'else if({value} == ' if i > 0 else f'if({value} == '
 					get(pattern)
 					if when: self += ' && '; get(when)
 					self += ')'
-				self.write(code)
+					self.write(code)
+			if default != None: self.write(default)
 	
 	def end_class(self, name):
 		# add ready function if there are onready_assigns remaining
@@ -386,7 +560,13 @@ class Transpiler:
 		while len(self.layers) > 1: self.write(self.popLayer())
 		while self.level > 0: self.DownScope()
 		
-		self.cs = header + prettify(str(self.getLayer()))
+		cs = open(self.out_path(), 'w+') if stream_output else StringBuilder()
+		cs.write(header)
+		prettify = prettifier()
+		for line in self.getLayer().lines(): cs.write(prettify(line))
+		
+		if stream_output: cs.close()
+		else: self.cs = str(cs)
 	
 	def comment(self, content):
 		self += f"//{content}"
@@ -414,10 +594,17 @@ class Transpiler:
 		return (self.cs,) 
 	
 	def save_result(self):
-		if not self.out_name.endswith('.cs'): self.out_name += '.cs'
-		with open(self.out_name,'w+') as wf:
+		# already written by end_script
+		if stream_output: return
+		with open(self.out_path(),'w+') as wf:
 			wf.write(self.get_result()[0])
 	
+	# no project-wide files for C#
+	def save_project(self, out_dir): pass
+	
+	def out_path(self):
+		return self.out_name if self.out_name.endswith('.cs') else self.out_name + '.cs'
+	
 	def UpScope(self):
 		self.vprint('UpScope')
 		self += '\n{'
@@ -443,14 +630,22 @@ class Transpiler:
 		self.layers.pop()
 		return scope
 
-def translate_type(type):
+def translate_type(type): return _translate_type(type, use_floats)
+
+@lru_cache(maxsize=1024)
+def _translate_type(type, use_floats):
 	if type == None: return 'void'
-	if type.endswith('[]'): return f'Array<{type[:-2]}>'
+	if type.endswith('[]'): return f'Array<{_translate_type(type[:-2], use_floats)}>'
+	if type.startswith('Dictionary<'):
+		key, value = type[len('Dictionary<'):-1].split(',', 1)
+		return f'Dictionary<{_translate_type(key, use_floats)}, {_translate_type(value, use_floats)}>'
 	if type.endswith('enum'): return type[:-len('enum')]
+	if type.endswith('signal'): return 'Signal'
 	if type == 'float' and not use_floats: return 'double'
 	if isVariantType(type): return type
-	if type.split('.') [-1] in godot_types: return f'Godot.{type}'
+	if type.split('.') [-1] in engine_types: return f'Godot.{type}'
 	return type
+type_caches.append(_translate_type)
 
 def rReplace(string, toReplace, newValue, n = 1): return newValue.join(string.rsplit(toReplace,n))
 
@@ -469,9 +664,71 @@ def replaceClosingBrace(string, replacement):
 			yield c
 	return ''.join(impl())
 
+# what follows the first block (ex: the scopes it closes)
+def afterBlock(string):
+	open_brackets = 0
+	for i, c in enumerate(string):
+		if c == '{': open_brackets += 1
+		elif c == '}':
+			open_brackets -= 1
+			if open_brackets == 0: return string[i+1:]
+	return ''
+
 def toPrivate(name): return '_' + name
 
+# Pascal-case names, shared by all scripts transpiled in the same run
+# NOTE: grows with user identifiers, but those are bounded by the project size
+pascal_names = {}
+
+# value of an int literal, None if not a literal
+def intLiteral(code):
+	try: return int(code.replace(' ', ''))
+	except ValueError: return None
+
+# anything but a literal may change while looping (ex: the loop assigns it)
+def needsEvaluation(code): return intLiteral(code) == None
+
+# typed delegate for a lambda
+def toDelegateType(params, return_type):
+	types = [ translate_type(type) for type in params.values() ]
+	if return_type in (None, 'void'):
+		return f'System.Action<{", ".join(types)}>' if types else 'System.Action'
+	return f'System.Func<{", ".join(types + [translate_type(return_type)])}>'
+
+# gdscript format specifiers ex: %s %5d %-8.2f %%
+FORMAT_SPECIFIER = regex.compile(r'%[-+ 0]*(?:\d+|\*)?(?:\.(?:\d+|\*))?[scdoxXfv%]')
+
+# C# interpolation item for a value formatted by a gdscript specifier
+def toFormatItem(value, spec):
+	flags, width, precision, kind = regex.fullmatch(r'%([-+ 0]*)(\d*)(?:\.(\d+))?(\w)', spec).groups()
+	if kind == 'c': value = f'(char){value}'
+	if kind == 'o': value = f'System.Convert.ToString({value}, 8)'
+	padded = kind == 'd' and '0' in flags and width
+	# signs of positive numbers need a custom format (ex: +0;-0)
+	sign = '+' if '+' in flags else ' ' if ' ' in flags else None
+	if sign and kind in ('d', 'f'):
+		digits = '0' * (int(width) - 1 if padded else 1)
+		if kind == 'f' and int(precision or 6): digits += '.' + '0' * int(precision or 6)
+		format = f'{sign}{digits};-{digits}'
+	else:
+		format = 'D' + width if padded \
+			else f'F{precision or 6}' if kind == 'f' \
+			else kind if kind in ('x', 'X') \
+			else ''
+	alignment = f',{"-" if "-" in flags else ""}{width}' if width and not padded else ''
+	return f'{value}{alignment}{":" + format if format else ""}'
+
+# constants are pascal case in C#, except those that are not all uppercase in gdscript
+def constantName(name):
+	return name if not name.isupper() else toPascal(name.lower())
+
 def toPascal(text):
+	pascal = pascal_names.get(text)
+	if pascal == None:
+		pascal = pascal_names[text] = _toPascal(text)
+	return pascal
+
+def _toPascal(text):
 	split_ = text.split('_')
 	
 	# for legible contants
@@ -483,15 +740,41 @@ def toPascal(text):
 	capitalize = lambda s: s[0].upper() + s[1:] if s else s
 	return  '_' * nStart_ + ''.join( map(capitalize, split_ ) )
 
+# godot api names recur in every script, so they are converted once
+# and saved next to the type definitions
+PASCAL_SAVEFILE = local_path + '/pascal_names.pickle'
+
+def _load_pascal_names():
+	if os.path.exists(PASCAL_SAVEFILE) \
+		and os.path.getmtime(PASCAL_SAVEFILE) >= os.path.getmtime(SAVEFILE):
+		with open(PASCAL_SAVEFILE, 'rb') as f:
+			pascal_names.update(load(f))
+		return
+	
+	for klass in godot_types.values():
+		for name in (*klass.methods, *klass.members): toPascal(name)
+	
+	# the addon folder may be read-only, the cache is only an optimization
+	try:
+		with open(PASCAL_SAVEFILE, 'wb+') as f:
+			save(pascal_names, f)
+	except OSError: pass
+
+_load_pascal_names()
+
 def isVariantType(type):
-	match = (vt for vt in variant_types if vt.replace('TYPE_', '', 1).replace('_','') == type.upper() if type != 'Object')
-	return next(match, None) != None
+	return type != 'Object' and type.upper() in variant_type_constants
+
+def isArrayType(type): return type == 'Array' or bool(type) and type.endswith('[]')
+def isDictionaryType(type): return bool(type) and type.startswith('Dictionary')
 
 # for prettier output
-def prettify(value):
-	def impl():
-		cnt = 0
-		line = ''
+# NOTE: keeps state between calls, so code can be prettified chunk by chunk
+def prettifier():
+	cnt = 0
+	line = ''
+	def impl(value):
+		nonlocal cnt, line
 		for c in value:
 			if c == '\n':
 				line = ''
@@ -501,7 +784,7 @@ def prettify(value):
 			elif cnt > 0 and c == ' ':  line += c
 			elif cnt > 0 and c == '\t': line += c
 			else: cnt = 0; yield line + c; line = ''
-	return ''.join(impl())
+	return lambda value: ''.join(impl(value))
 
 # trick for generator values
 get = next
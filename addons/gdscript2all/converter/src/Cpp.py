@@ -1,6 +1,23 @@
+import os
 import re as regex
+from functools import lru_cache
 from godot_types import *
 from StringBuilder import StringBuilder
+from OutputStream import OutputStream
+
+# write code to the output files while transpiling (set by main.py)
+# useful for huge scripts, since memory use then scales with the biggest method
+stream_output = False
+
+# use packed arrays for typed arrays of packable types that stay in their method (set by main.py)
+use_packed_arrays = False
+
+# also generate a unity translation unit including every generated cpp,
+# and a shared header with every godot include they use (set by main.py)
+unity_build = False
+
+# cache singletons used in loops into locals declared before them (set by main.py)
+loop_hoisting = False
 
 # ClassDefinition
 # contains the code being generated for a class
@@ -27,6 +44,9 @@ class ClassDefinition:
 		# static assignments, moved to the end of hpp
 		self.static_assigns = []
 		
+		# non-trivial member default values, moved to the constructor (tuple<member_name,value>)
+		self.member_inits = []
+		
 		# annotations (tuple<property_name,annotation_name,params> )
 		self.annotations = []
 		
@@ -50,12 +70,22 @@ class Transpiler:
 	
 	def __init__(self, script_name, out_name, vprint):
 		
-		self.script_name = script_name
-		self.out_name = out_name
-		
 		# verbose printing
 		self.vprint = vprint
 		
+		# for the unity build : used types and generated cpp of every script
+		self.project_types = set()
+		self.project_sources = []
+		
+		self.reset(script_name, out_name)
+	
+	# prepare the transpiler for another script
+	# NOTE: allows to reuse a transpiler for batches of files
+	def reset(self, script_name, out_name):
+		
+		self.script_name = script_name
+		self.out_name = out_name
+		
 		# scope level
 		self.level = 0
 		
@@ -66,14 +96,27 @@ class Transpiler:
 		
 		# to generate includes
 		self.used_types = set()
+		
+		# types named in the header (type:needs the complete type)
+		self.header_types = {}
+		
+		# static constants of the next defined method
+		self.method_constants = []
+		
+		# names used through StringName accessors (name:None)
+		self.string_names = {}
+		
+		# locals declared before loops by hoist_invariants, in the method being defined
+		self.hoisted_locals = set()
 
 		# allows to parse code and rearrange it
-		self.layers = [StringBuilder()]
+		# NOTE: the bottom layer is the cpp
+		self.layers = [OutputStream() if stream_output else StringBuilder()]
 		
 		# result hpp
-		self.hpp = StringBuilder()
+		self.hpp = OutputStream() if stream_output else StringBuilder()
 		# result cpp
-		self.cpp = StringBuilder()
+		self.cpp = ''
 		
 	
 	# ClassData (methods and member types, generated by parser)
@@ -106,18 +149,24 @@ class Transpiler:
 	
 	def declare_property(self, type, name, assignment, accessors, constant, static, onready):
 		const_decl = 'const ' if constant else 'static ' if static else ''
+		translated = self.translate_type(type)
 		protected = self.getClass().protected()
-		protected += f'\t{const_decl}{self.translate_type(type)} {name}'
+		protected += f'\t{const_decl}{translated} {name}'
 		if assignment:
 			self.addLayer()
 			if onready:
 				self += name; self.assignment(assignment)
 				self.getClass().onready_assigns.append(self.popLayer())
 			elif static:
-				self += f'{type} {self.class_name}::{name}'; self.assignment(assignment)
+				self += f'{self.translate_type(type)} {self.class_name}::{name}'; self.assignment(assignment)
 				self.getClass().static_assigns.append(self.popLayer())
 			else:
-				self.assignment(assignment); protected += self.popLayer()
+				self.assignment(assignment); value = self.popLayer()
+				# only literal-like defaults stay in the header
+				if TRIVIAL_INITIALIZER.fullmatch(value[3:].strip()): protected += value
+				else: self.getClass().member_inits.append((name, value[3:].strip()))
+		# raw pointers aren't null by default
+		if (onready or not assignment) and not static and translated.endswith('*'): protected += ' = nullptr'
 		protected += ';'
 
 		# setget
@@ -149,11 +198,30 @@ class Transpiler:
 		self.getClass().accessors_set[member] = toSet(member)
 		self.define_method(toSet(member), code = code, params = {valueName:self.klass.members[member]})
 	
+	# value built on the first call of the method
+	def declare_constant(self, type, name, value):
+		self.addLayer()
+		self += f'static const {self.translate_type(type)} {name} = '; get(value)
+		self.method_constants.append(self.popLayer())
+	
 	def declare_variable(self, type, name, assignment):
 		self += f'{self.translate_type(type)} {name}'
 		if assignment: self.assignment(assignment)
 	
-	def define_method(self, name, params = {}, params_init = {}, return_type = None, code = '', static = False, override = False):
+	# typed array that stays in its method, so it can be packed without changing semantics
+	def declare_list(self, type, name, assignment):
+		packed = use_packed_arrays and packedArray(type, use_floats)
+		if not packed: self.declare_variable(type, name, assignment); return
+		self += f'{packed[0]} {name}'
+		self.assignment(assignment)
+	
+	# locals declared as Variant but always assigned the same type
+	def narrow_locals(self, code, narrowed):
+		for name, type in narrowed.items():
+			code = regex.sub(rf'\bVariant {name};', f'{self.translate_type(type)} {name};', code)
+		return code
+	
+	def define_method(self, name, params = {}, params_init = {}, return_type = None, code = '', static = False, override = False, virtual = False):
 
 		# for method bindings
 		self.getClass().method_args[name] = params.keys()
@@ -174,12 +242,20 @@ class Transpiler:
 					def_ += ' = ' + self.popLayer()
 			return def_
 		
-		static_str = 'static ' if static else ''
+		static_str = 'static ' if static else 'virtual ' if virtual else ''
 		override_str = ' override' if override else ''
 		public = self.getClass().public()
 		public += f'\t{static_str}{self.translate_type(return_type)} {name}({paramStr(True)}){override_str};\n' # hpp
 		self += f'{self.translate_type(return_type)} {self.class_name}::{name}({paramStr(False)})' # cpp
 		
+		# add method constants at the start of the body
+		if self.method_constants:
+			tabs = '\t' * (self.level +1)
+			code = code.replace('{', '{' + ''.join(map(lambda stmt: f'\n{tabs}{stmt};', self.method_constants)), 1)
+			self.method_constants.clear()
+		
+		self.hoisted_locals.clear()
+		
 		# add onready assignments if method is _ready
 		if name == '_ready' and self.getClass().onready_assigns:
 			onreadies = self.getClass().onready_assigns
@@ -190,6 +266,17 @@ class Transpiler:
 		
 		self.write(code)
 	
+	# constructor with a member initializer list
+	def define_constructor(self):
+		public = self.getClass().public()
+		public += f'\t{self.class_name}();\n' # hpp
+		self += f'{self.class_name}::{self.class_name}() :' # cpp
+		
+		tabs = '\t' * (self.level +1)
+		inits = self.getClass().member_inits
+		self.write(','.join( f'\n{tabs}{name}({value})' for name, value in inits ) + '\n{\n}')
+		inits.clear()
+	
 	def define_signal(self, name, params):
 		self.getClass().signals[name] = params
 		paramStr = ', '.join( ( f'{self.translate_type(pType)} {pName}' for pName, pType in params.items()))
@@ -202,34 +289,87 @@ class Transpiler:
 	def subexpression(self, expression):
 		self += '('; get(expression); self += ')'
 	
-	def create_array(self, values):
-		self += 'Array'
-		if values:
-			self.level += 1
-			self += ' {/* initializer lists are unsupported */ ' + values + ' }'
-			self.level -= 1
-		else: self += '()'
+	# packed arrays are filled through a pointer to their data
+	def create_list(self, values, type):
+		packed = use_packed_arrays and packedArray(type, use_floats)
+		if not packed: self.create_array(values, type); return
+		items = splitItems(values)
+		# NOTE: packed arrays are copied on write, so constant ones can be shared
+		self.fillCollection(packed[0], \
+			[ (comments, f'_items[{i}] = {item};') for i, (comments, item) in enumerate(items) ], \
+			f'_literal.resize({len(items)});\n{packed[1]} *_items = _literal.ptrw();', [ item for _, item in items ], copy = '')
+	
+	def create_array(self, values, type = None):
+		items = splitItems(values)
+		self.fillCollection(self.translate_type(type or 'Array'), \
+			[ (comments, f'_literal[{i}] = {item};') for i, (comments, item) in enumerate(items) ], \
+			len(items) and f'_literal.resize({len(items)});', [ item for _, item in items ], copy = '.duplicate()')
 
+	# NOTE: items are split from each other by create_array
 	def array_item(self, item):
-		get(item); self += ', '
+		get(item); self.write(ITEM_END)
 		
-	def create_dict(self, values):
-		self += 'Dictionary'; 
-		if values:
+	def create_dict(self, values, type = None):
+		items = [ (comments, item.split(KEY_END)) for comments, item in splitItems(values) ]
+		self.fillCollection(self.translate_type(type or 'Dictionary'), \
+			[ (comments, f'_literal[{key}] = {value};') for comments, (key, value) in items ], \
+			None, [ part for _, item in items for part in item ], copy = '.duplicate()')
+	
+	# literals are built by a lambda called in place, so they can be used in any expression
+	# NOTE: constant literals are built once, then copied
+	def fillCollection(self, type, assignments, reserve, parts, copy):
+		if not parts: self += f'{type}()'; return
+		
+		# class members are indented by the class definition
+		member = self.level == 0
+		if member: self.level += 1
+		
+		if not all( LITERAL.fullmatch(part) for part in parts ):
+			self.buildCollection('&', type, assignments, reserve)
+		else:
+			self += '[]() {'
 			self.level += 1
-			self += ' {/* initializer lists are unsupported */ ' + values + ' }'
+			self += f'\nstatic const {type} _literal = '; self.buildCollection('', type, assignments, reserve); self += ';'
+			self += f'\nreturn _literal{copy};'
 			self.level -= 1
-		else: self += '()'
-
+			self += '\n}()'
+		
+		if member: self.level -= 1
+	
+	def buildCollection(self, capture, type, assignments, reserve):
+		self += f'[{capture}]() {{'
+		self.level += 1
+		self += f'\n{type} _literal;'
+		if reserve: self += f'\n{reserve}'
+		for comments, assignment in assignments:
+			for comment in comments: self += f'\n{comment}'
+			# items are already indented for this level
+			self += '\n'; self.write(assignment)
+		self += '\nreturn _literal;'
+		self.level -= 1
+		self += '\n}()'
+	
+	# formatted at runtime, as in gdscript
+	def string_format_array(self, format, array):
+		self += 'String('; self.string(format); self += ') % '; get(array)
+	
+	# vformat takes the same specifiers as gdscript
+	def string_format(self, format, values):
+		self += 'vformat('; self.string(format)
+		for value in values: self += ', '; get(value)
+		self += ')'
+	
 	def dict_item(self, key, value):
-		self += '{'; get(key); self += ', '; get(value); self += '},'
+		get(key); self.write(KEY_END); get(value); self.write(ITEM_END)
 	
-	def create_lambda(self, params, code):
-		self += '[]('
+	def create_lambda(self, params, code, return_type, captures, in_method):
+		# captured values are copied, as lambdas often outlive their scope (ex: signal callbacks)
+		self += '[=](' if captures else '[]('
 		for i, (pName, pType) in enumerate(params.items()):
 			if i != 0: self += ', '
 			self += f'{self.translate_type(pType)} {pName}'
 		self += ') '
+		if return_type not in (None, 'void'): self += f'-> {self.translate_type(return_type)} '
 		# cleanup
 		code = code.replace('{', '{\t', 1)
 		code = replaceClosingBrace(code, '};' )
@@ -283,8 +423,11 @@ class Transpiler:
 		self += ')'
 	
 	def constructor(self, name, type, params):
-		if is_pointer(type): self += 'new '
-		self.call(type, name, params)
+		if not is_pointer(type): self.call(type, name, params); return
+		self += 'memnew('
+		if params: self.call(type, name, params)
+		else: self += name
+		self += ')'
 	
 	def subscription(self, key):
 		self+= '['; get(key); self += ']'
@@ -297,6 +440,12 @@ class Transpiler:
 		if op == '!': self += op
 		else: self += f' {op} '
 	
+	def cast(self, exp, type, cast):
+		cast_type = self.translate_type(cast)
+		if cast_type.startswith('Ref<'): self += f'{cast_type}('
+		else: self += f'Object::cast_to<{cast_type[:-1]}>('
+		get(exp); self += ')'
+	
 	def check_type(self, exp, checked):
 		# NOTE : not perfect depending on the types given. a good start nonetheless
 		self+= f'(bool)dynamic_cast<{checked}*>(&'; get(exp); self+=')'
@@ -322,75 +471,149 @@ class Transpiler:
 		self += 'while('; get(condition); self += ')'
 		
 	def forStmt(self, name, type, exp):
-		# no custom range operator in c++ afaik
-		self.addLayer(); get(exp); iterator = self.popLayer()
-		if iterator.startswith('range'):
-			iterator = iterator.replace('range(', '', 1)[:-1]
-			# just splitting by ',' would allow some bugs
-			# ex: 'i in range(func(j,k))'' => 'for(int i=func(j; i<k); i+=1)''
-			params = splitArgs(iterator)
-			start = params[0].strip() if len(params)>1 else 0
-			end = params[0].strip() if len(params)==1 else params[1]
-			step = params[2].strip() if len(params)==3 else 1
-			# NOTE: will generate '+= -' for negative step ; acceptable to me
-			self += f'for({self.translate_type(type)} {name}={start}; {name}<{end}; {name}+={step})'
+		self += f'for({self.translate_type(type)} {name} : '; get(exp); self += ')'
+	
+	# range(end) / range(start, end) / range(start, end, step)
+	# no custom range operator in c++ afaik
+	def forRangeStmt(self, name, type, params):
+		args = []
+		for p in params:
+			self.addLayer(); get(p); args.append(self.popLayer())
+		if len(args) == 1: args.insert(0, '0')
+		start, end, step = (*args, '1')[:3]
+		
+		# range() is evaluated once, so are the bounds
+		declarations = f'{name}={start}'
+		if needsEvaluation(end): declarations += f', {name}_end={end}'; end = f'{name}_end'
+		if needsEvaluation(step): declarations += f', {name}_step={step}'; step = f'{name}_step'
+		
+		# direction is only known at runtime for non-literal steps
+		step_value = intLiteral(step)
+		if step_value == None:
+			condition = f'({step}>0 ? {name}<{end} : {name}>{end})'
+			increment = f'{name}+={step}'
+		elif step_value < 0:
+			condition = f'{name}>{end}'
+			increment = f'{name}-={-step_value}'
 		else:
-			self += f'for({self.translate_type(type)} {name} : {iterator})'
+			condition = f'{name}<{end}'
+			increment = f'{name}+={step_value}'
+		
+		self += f'for({self.translate_type(type)} {declarations}; {condition}; {increment})'
+	
+	# declare singleton lookups before the loop (code starts at the loop statement)
+	# they never change, unlike getters which the loop or its calls may affect
+	def hoist_invariants(self, code):
+		# lambdas may be called from elsewhere
+		if not loop_hoisting or regex.search(r'\[=?\]\(', code): return code
+		
+		indent = regex.match(r'[^\n]*\n(\t*)', code)
+		indent = indent.group(1) if indent else '\t' * self.level
+		declarations = ''
+		
+		def hoist(pattern, expression, name):
+			nonlocal code, declarations
+			name = self.hoistedName(name, code)
+			declarations += f'auto {name} = {expression};\n{indent}'
+			code = pattern.sub(name, code)
+		
+		# NOTE: only singletons are invariant, getters may return a different value at each iteration
+		for singleton in dict.fromkeys(SINGLETON_LOOKUP.findall(code)):
+			hoist(regex.compile(rf'\b{singleton}::get_singleton\(\)'), f'{singleton}::get_singleton()', f'{toSnakeCase(singleton)}_singleton')
+		
+		return declarations + code
+	
+	# local name that doesn't shadow a member, a used name or another hoisted local
+	def hoistedName(self, name, code):
+		used = set(regex.findall(r'\w+', code)) | self.hoisted_locals | set(self.klass.members)
+		unique, i = name, 2
+		while unique in used: unique = f'{name}{i}'; i += 1
+		self.hoisted_locals.add(unique)
+		return unique
 	
 	def breakStmt(self): self += 'break;'
 	
 	def continueStmt(self): self += 'continue;'
 	
-	def awaitStmt(self, object, signalName):
+	def awaitStmt(self, object, signalName, owner):
 		object = object.replace('self', 'this')
 		signalName = rReplace(rReplace(signalName, 'get_', '', 1), '()', '', 1)
 		self += f'/* await {object}->{signalName}; */ // no equivalent to await in c++ !'
 	
-	def emitSignal(self, name, params):
-		self += f'emit_signal("{name}"'
+	def emitSignal(self, name, params, owner):
+		self += f'emit_signal({self.stringName(name)}'
 		for i, p in enumerate(params):
 			self += ', '
 			get(p)
 		self += ')'
 	
+	def getNode(self, path, type):
+		self += f'get_node<{self.translate_type(type)[:-1]}>(' if type != 'Node' else 'get_node('
+		self.string(path); self += ')'
+	
 	def connectSignal(self, name, params):
-		self += f'connect("{name}", '; get(params[0]); self += ')'
+		self += f'connect({self.stringName(name)}, '; get(params[0]); self += ')'
+	
+	# accessor to a StringName built once, instead of converting a string at every call
+	def stringName(self, name):
+		self.string_names[name] = None
+		return f'_sn_{name}()'
 	
 	def matchStmt(self, evaluated, cases):
 		type = get(evaluated)
 
-		# use switch on literals
-		if type in ('int', 'string', 'float'):
+		# use switch on integers and enums
+		# NOTE: c++ can't switch on strings or floats
+		if type == 'int' or type and type.endswith('enum'):
 			
 			self += 'switch('; get(evaluated); self += ')'
 			self.UpScope()
 			
+			# NOTE: cases after the default one are unreachable in gdscript,
+			# only the scopes they close are kept
+			default = None
 			for pattern, when, code in cases():
+				if default != None: default = default.rstrip() + afterBlock(code); continue
 				if pattern == 'default':
 					self += 'default:'
 				else:
 					self += 'case '; get(pattern); self += ':'
 					if when: self += ' if('; get(when); self += ')'
 				code = replaceClosingBrace(code, '\tbreak; }')
-				self.write(code)
+				if pattern == 'default': default = code
+				else: self.write(code)
+			if default != None: self.write(default)
 		
-		 # default to if else chains for objects
+		# default to if else chains for objects
+		# NOTE: the value is evaluated once, as it may have side effects
+		# the scope keeps its temporary local to the match
 		else:
-			self.addLayer()
-			self += 'if('
-			get(evaluated)
-			self += ' == '
-			comparison = self.popLayer()
+			self.addLayer(); get(evaluated); value = self.popLayer()
+			# NOTE: the scope opens at the statement position, closed by the parser like other blocks
+			self += '{'
+			self.level += 1
+			# NOTE: suffixed by the level for nested matches
+			if not value.replace('.', '_').isidentifier():
+				temp = f'_match{self.level}'
+				self += f'\nauto {temp} = {value};'
+				value = temp
 			
-			for pattern, when, code in cases():
+			# a default case ends the chain, or is the only block if first
+			# NOTE: cases after the default one are unreachable in gdscript,
+			# only the scopes they close are kept
+			default = None
+			for i, (pattern, when, code) in enumerate(cases()):
+				if default != None: default = default.rstrip() + afterBlock(code); continue
 				if pattern == 'default':
-					self += 'else '
+					if i > 0: self += 'else '
+					default = code if i > 0 else code.lstrip()
 				else:
-					self.write(comparison)
+					self += f'else if({value} == ' if i > 0 else f'if({value} == '
 					get(pattern)
 					if when: self += ' && '; get(when)
 					self += ')'
-				self.write(code)
+					self.write(code)
+			if default != None: self.write(default)
 	
 	def end_class(self, name):
 		# add ready function if there are onready_assigns remaining
@@ -400,6 +623,8 @@ class Transpiler:
 		# (or replacing a dummy string ex:__READY__ if _ready was defined by user)
 		if self.getClass().onready_assigns: self.define_method('_ready', override=True)
 		
+		if self.getClass().member_inits: self.define_constructor()
+		
 		# bindings -> _bind_methods() static function
 		if self.getClass().annotations or self.klass.methods or self.getClass().signals:
 			# NOTE: we generate property bindings first so we can generate missing get set methods,
@@ -464,18 +689,26 @@ class Transpiler:
 			self.define_method('_bind_methods', code = str(bindings), static = True)
 		
 		# add class definition + close it
+		self.classifyHeaderUses(str(self.getClass().class_hpp))
 		self.hpp += self.getClass().class_hpp
 		self.hpp += '};\n\n'
 
 		# add static assignment
 		for sass in self.getClass().static_assigns:
-			self.cpp += f'{sass};\n'
+			self.write(f'{sass};\n')
 
 		# add enum binding after class binding (if any)
 		if self.klass.enums:
 			self.hpp += '\n'.join( f'VARIANT_ENUM_CAST({self.getClass().name}::{self.translate_type(enum_name)})'  \
 				for enum_name in sorted(set(self.klass.enums.values())) if self.translate_type(enum_name))
 	
+	# the header only needs a declaration for types it uses as pointers
+	def classifyHeaderUses(self, code):
+		code = regex.sub(COMMENT, '', code)
+		for type in self.used_types:
+			for match in regex.finditer(rf'\b{type}\b(\s*\*)?', code):
+				self.header_types[type] = self.header_types.get(type, False) or not match.group(1)
+	
 	def end_script(self):
 		self.end_class(self.class_name)
 		
@@ -483,48 +716,67 @@ class Transpiler:
 		while len(self.layers) > 1: self.write(self.popLayer())
 		while self.level > 0: self.DownScope()
 
-		# generate includes
-		to_camel_case = lambda s: regex.sub(r'(?<!^)(?=[A-Z])', '_', s).lower()
-		to_include = lambda s: '#include <godot_cpp/classes/' \
-			+ to_camel_case(s) \
-			.replace('2_d', '2d') \
-			.replace('3_d', '3d') \
-			+ '.hpp>'
-		includes =  '\n'.join(map(to_include, sorted(self.used_types))) + '\n'
-
-		self.cpp = prettify( cpp_template \
-			.replace('__HEADER__', self.script_name) \
-			+ str(self.getLayer()).replace('\n}', '\n}\n\n') \
-			)
-		self.hpp = prettify( hpp_template \
+		# generate includes : the header only includes types it needs complete
+		# and forward declares those it only uses as pointers, the cpp includes the rest
+		# NOTE: user classes aren't declared in the godot namespace
+		# and those of this script are defined in its header
+		self.used_types -= self.class_definitions.keys()
+		complete = { t for t in self.used_types if self.header_types.get(t) or t not in engine_types }
+		declared = { t for t, needed in self.header_types.items() if not needed } - complete
+		hpp_includes =  '\n'.join(map(toInclude, sorted(complete))) + '\n'
+		if declared: hpp_includes += '\nnamespace godot {\n' + ''.join( f'class {t};\n' for t in sorted(declared) ) + '}\n'
+		cpp_includes = ''.join( toInclude(t) + '\n' for t in sorted(self.used_types - complete) )
+		
+		hpp_start, hpp_end = hpp_template \
 			.replace('__CLASS__', self.script_name.upper()) \
-			.replace('__INCLUDES__', includes) \
-			.replace('__IMPLEMENTATION__', str(self.hpp)) \
-			)
+			.replace('__INCLUDES__', hpp_includes) \
+			.split('__IMPLEMENTATION__')
+		cpp_start = cpp_template.replace('__HEADER__', self.script_name).replace('__INCLUDES__', cpp_includes) \
+			+ ''.join( (unity_string_name_template if unity_build else string_name_template).replace('__NAME__', name) for name in self.string_names ) \
+			+ ('\n' if self.string_names else '')
+		
+		# add spacing after method definitions
+		cpp_lines = ( '}\n\n' + line[1:] if i > 0 and line.startswith('}') else line \
+			for i, line in enumerate(self.getLayer().lines()) )
+		
+		hpp_path, cpp_path = self.out_paths()
+		self.project_types.update(self.used_types)
+		self.project_sources.append(cpp_path)
+		
+		self.hpp = self.write_result(hpp_path, (hpp_start,), self.hpp.lines(), (hpp_end,))
+		self.cpp = self.write_result(cpp_path, (cpp_start,), cpp_lines)
+	
+	# prettify code chunks into the output file when streaming, into a string otherwise
+	def write_result(self, path, *parts):
+		result = open(path, 'w+') if stream_output else StringBuilder()
+		prettify = prettifier()
+		for chunks in parts:
+			for chunk in chunks: result.write(prettify(chunk))
+		if stream_output: result.close(); return ''
+		return str(result)
 
+	# trivial accessors are defined in the header, so calls to them can be inlined
 	def addDefaultSet(self, prop_name):
 		self.getClass().accessors_set[prop_name] = toSet(prop_name)
-		self.setter(prop_name, 'value', f' {{\n\t{prop_name} = value;\n}}\n')
+		self.define_inline_method(toSet(prop_name), f'{prop_name} = value;', params = {'value':self.klass.members[prop_name]})
 	def addDefaultGet(self, prop_name):
 		self.getClass().accessors_get[prop_name] = toGet(prop_name)
-		self.getter(prop_name, f' {{\n\treturn {prop_name};\n}}\n')
+		self.define_inline_method(toGet(prop_name), f'return {prop_name};', return_type = self.klass.members[prop_name])
+	
+	def define_inline_method(self, name, code, params = {}, return_type = None):
+		# for method bindings
+		self.getClass().method_args[name] = params.keys()
+		self.klass.methods[name] = return_type
+		
+		params_str = ', '.join( f'{self.translate_type(pType)} {pName}' for pName, pType in params.items() )
+		public = self.getClass().public()
+		public += f'\t{self.translate_type(return_type)} {name}({params_str}) {{ {code} }}\n'
 
 	def translate_type(self, type):
-		if type == None: return 'void'
-		if type == 'Variant': return type
-		if type == 'string': return 'String'
-		if type.endswith('[]'): return 'Array'
-		if type.endswith('enum'): return type[:-len('enum')].replace('.', '::')
-		if type == 'float' and not use_floats: return 'double'
-		if toVariantTypeConstant(type): return type
-
-		split = type.split('.')
+		translated, includes = _translate_type(type, use_floats)
 		# to generate includes
-		if split[-1] in godot_types: self.used_types.add(split[-1])
-		if len(split) > 1 and split[-2] in godot_types: self.used_types.add(split[-2])
-
-		type = '::'.join(split)
-		return f'Ref<{type}>'
+		self.used_types.update(includes)
+		return translated
 	
 	def comment(self, content):
 		handler = self.getWhitespaceHandler()
@@ -563,14 +815,10 @@ class Transpiler:
 		return (self.hpp, self.cpp)
 	
 	def save_result(self):
+		# already written by end_script
+		if stream_output: return
 		
-		# clean the extension, JIC
-		if '.' in self.out_name[-4:]:
-			self.out_name = '.'.join(self.out_name.split('.')[:-1])
-
-		cpp_outname = self.out_name + '.cpp'
-		hpp_out_name = self.out_name + '.hpp'
-		
+		hpp_out_name, cpp_outname = self.out_paths()
 		result = self.get_result()
 
 		with open(hpp_out_name,'w+') as wf:
@@ -579,6 +827,27 @@ class Transpiler:
 		with open(cpp_outname,'w+') as wf:
 			wf.write(result[1])
 	
+	# write the unity build files, once every script is transpiled
+	def save_project(self, out_dir):
+		if not unity_build: return
+		
+		# NOTE: user classes are included by their own cpp
+		includes = '\n'.join(map(toInclude, sorted(self.project_types & engine_types))) + '\n'
+		with open(os.path.join(out_dir, 'pch.hpp'), 'w+') as wf:
+			wf.write(pch_template.replace('__INCLUDES__', includes))
+		
+		sources = ''.join( f'#include "{os.path.relpath(path, out_dir).replace(os.path.sep, "/")}"\n' \
+			for path in sorted(self.project_sources) )
+		with open(os.path.join(out_dir, 'unity_build.cpp'), 'w+') as wf:
+			wf.write(unity_template.replace('__SOURCES__', sources))
+	
+	def out_paths(self):
+		out_name = self.out_name
+		# clean the extension, JIC
+		if '.' in out_name[-4:]:
+			out_name = '.'.join(out_name.split('.')[:-1])
+		return out_name + '.hpp', out_name + '.cpp'
+	
 	def UpScope(self):
 		self.vprint('UpScope', self.level)
 		self += '\n{'
@@ -622,43 +891,113 @@ def replaceClosingBrace(string, replacement):
 			yield c
 	return ''.join(impl())
 
-def splitArgs(string):
-	def impl():
-		open_parenthesis = 0
-		start = 0
-		for i, c in enumerate(string):
-			if c == '(': open_parenthesis += 1
-			elif c == ')':
-				open_parenthesis -= 1
-			elif c == ',' and open_parenthesis == 0:
-				yield string[start:i]
-				start = i+1
-		yield string[start:]
-	return [ item for item in impl()]
+# what follows the first block (ex: the scopes it closes)
+def afterBlock(string):
+	open_brackets = 0
+	for i, c in enumerate(string):
+		if c == '{': open_brackets += 1
+		elif c == '}':
+			open_brackets -= 1
+			if open_brackets == 0: return string[i+1:]
+	return ''
+
+# value of an int literal, None if not a literal
+def intLiteral(code):
+	try: return int(code.replace(' ', ''))
+	except ValueError: return None
+
+# separators of collection literal items, so create_array/create_dict can split them
+ITEM_END = '\x1f'
+KEY_END = '\x1e'
+
+# (comments, code) of each item of a collection literal
+# NOTE: comments between items are moved out of the code
+def splitItems(values):
+	if not values: return []
+	def split(item):
+		comments, code = LEADING_COMMENTS.match(item).groups()
+		return COMMENT.findall(comments), code.strip()
+	return [ split(item) for item in values.split(ITEM_END)[:-1] ]
+
+COMMENT = regex.compile(r'//[^\n]*|/\*.*?\*/', regex.S)
+LEADING_COMMENTS = regex.compile(r'((?:\s*(?://[^\n]*|/\*.*?\*/))*)(.*)', regex.S)
+
+# number, string or boolean literal
+LITERAL = regex.compile(r'(?:- ?)?[\d.][\w.]*|"(?:[^"\\]|\\.)*"|true|false')
+
+# literals, constants and value types built from literals
+TRIVIAL_INITIALIZER = regex.compile(rf'{LITERAL.pattern}|nullptr|[\w:]+|[A-Z]\w*\(((?:{LITERAL.pattern})(?:, (?:{LITERAL.pattern}))*)?\)', regex.S)
+
+# anything but a literal may change while looping (ex: the loop assigns it)
+def needsEvaluation(code): return intLiteral(code) == None
+
+SINGLETON_LOOKUP = regex.compile(r'\b([A-Z]\w*)::get_singleton\(\)')
+
+def toSnakeCase(name): return regex.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
 
 def toSet(name): return f'set_{name}'
 def toGet(name): return f'get_{name}'
 
 def is_pointer(type): return type and not toVariantTypeConstant(type)
 
+# returns (translated type, types to include)
+@lru_cache(maxsize=1024)
+def _translate_type(type, use_floats):
+	if type == None: return 'void', ()
+	if type == 'Variant': return type, ()
+	if type == 'string': return 'String', ()
+	if type.endswith('[]'): return 'Array', ()
+	if type.startswith('Dictionary<'): return 'Dictionary', ()
+	if type.endswith('enum'): return type[:-len('enum')].replace('.', '::'), ()
+	if type.endswith('signal'): return 'Signal', ()
+	if type == 'float' and not use_floats: return 'double', ()
+	if toVariantTypeConstant(type): return type, ()
+
+	split = type.split('.')
+	includes = tuple( t for t in split[-2:] if t in godot_types )
+	type = '::'.join(split)
+	# only RefCounted objects are reference counted
+	if inherits(split[-1], 'Object') and not inherits(split[-1], 'RefCounted'): return f'{type}*', includes
+	return f'Ref<{type}>', includes
+type_caches.append(_translate_type)
+
+# packed array and element types by typed array element type
+PACKED_ARRAYS = {
+	'int': ('PackedInt64Array', 'int64_t'),
+	'float': ('PackedFloat64Array', 'double'),
+	'string': ('PackedStringArray', 'String'),
+	'String': ('PackedStringArray', 'String'),
+	'Vector2': ('PackedVector2Array', 'Vector2'),
+	'Vector3': ('PackedVector3Array', 'Vector3'),
+	'Vector4': ('PackedVector4Array', 'Vector4'),
+	'Color': ('PackedColorArray', 'Color'),
+}
+
+# (packed array type, element type) of a typed array, None if it can't be packed
+def packedArray(type, use_floats):
+	element = type[:-len('[]')]
+	if element == 'float' and use_floats: return ('PackedFloat32Array', 'float')
+	return PACKED_ARRAYS.get(element)
+
 def toVariantTypeConstant(type):
 	# NOTE: binding enums as int ; that's the standards afaik
 	# see https://github.com/godotengine/godot/issues/15922
 	if   type.endswith('enum'): type = 'int'
 	elif type.endswith('[]'): type = 'Array'
 
-	match = (vt for vt in variant_types if vt.replace('TYPE_', '', 1).replace('_','') == type.upper())
-	return next(match, None)
+	return variant_type_constants.get(type.upper())
 
 def toVariantTypeEnum(type):
 	translated = toVariantTypeConstant(type)
 	return 'Variant::' + (translated.replace('TYPE_', '', 1) if translated else 'OBJECT')
 
 # for prettier output
-def prettify(value):
-	def impl():
-		cnt = 0
-		line = ''
+# NOTE: keeps state between calls, so code can be prettified chunk by chunk
+def prettifier():
+	cnt = 0
+	line = ''
+	def impl(value):
+		nonlocal cnt, line
 		for c in value:
 			if c == '\n':
 				line = ''
@@ -668,7 +1007,15 @@ def prettify(value):
 			elif cnt > 0 and c == ' ':  line += c
 			elif cnt > 0 and c == '\t': line += c
 			else: cnt = 0; yield line + c; line = ''
-	return ''.join(impl())
+	return lambda value: ''.join(impl(value))
+
+def toInclude(type):
+	to_camel_case = lambda s: regex.sub(r'(?<!^)(?=[A-Z])', '_', s).lower()
+	return '#include <godot_cpp/classes/' \
+		+ to_camel_case(type) \
+		.replace('2_d', '2d') \
+		.replace('3_d', '3d') \
+		+ '.hpp>'
 
 # trick for generator values
 get = next
@@ -689,13 +1036,46 @@ __IMPLEMENTATION__
 #endif // __CLASS___H
 """
 
+# NOTE: built on first use, since StringNames can't be created before the extension is initialized
+string_name_template = """static const StringName &_sn___NAME__() { static const StringName name("__NAME__"); return name; }
+"""
+
+# NOTE: guarded since every cpp ends up in the same translation unit
+# the prefix keeps the macros out of the identifiers reserved to the implementation
+unity_string_name_template = """#ifndef GD2A_SN___NAME__
+#define GD2A_SN___NAME__
+""" + string_name_template + """#endif
+"""
+
+pch_template = """
+#ifndef GDSCRIPT2ALL_PCH_H
+#define GDSCRIPT2ALL_PCH_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+__INCLUDES__
+
+using namespace godot;
+
+#endif // GDSCRIPT2ALL_PCH_H
+"""
+
+unity_template = """
+#include "pch.hpp"
+
+__SOURCES__"""
+
 cpp_template = """
 #include "__HEADER__.hpp"
 
 #include <godot_cpp/core/object.hpp>
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
-
+__INCLUDES__
 
 """
 
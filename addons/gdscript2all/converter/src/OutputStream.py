@@ -0,0 +1,22 @@
+from tempfile import TemporaryFile
+
+# StringBuilder counterpart for streamed output
+# code is stored in a temporary file instead of memory
+# so the start of the result (ex: includes) can be decided once the script is done
+class OutputStream:
+
+	def __init__(self):
+		self.file = TemporaryFile('w+', newline = '\n')
+
+	def __iadd__(self, txt):
+		self.write(str(txt))
+		return self
+
+	def write(self, txt):
+		self.file.write(txt)
+
+	# read code back, line by line
+	def lines(self):
+		self.file.seek(0)
+		yield from self.file
+		self.file.close()
@@ -1,5 +1,6 @@
 import re
 import os
+import math
 from copy import copy
 from enum import IntFlag as Flags
 
@@ -8,16 +9,41 @@ from ClassData import ClassData
 
 # NOTE: we add locally defined classes to godot_types
 # to avoid having to join definitions
-from godot_types import godot_types, GLOBALS, toSignalType, toEnumType
+from godot_types import godot_types, add_types, build_override_table, overridden_methods, inherits, GLOBALS, toSignalType, toEnumType
+
+# replace $node/%node lookups in methods by fields assigned on ready (set by main.py)
+# NOTE: lookups in methods running before _ready (ex: setters) will then get null
+cache_node_paths = False
+
+# typed array locals that stay in their method, gathered by the type resolving step
+# ({(class_name, method_name):{local_name}})
+local_lists = {}
+
+# node paths used where they can be cached, gathered by the type resolving step
+# and the node type of the fields caching them ({class_name:{node_path:type}})
+# NOTE: None until a typed variable holds the node
+node_paths = {}
+
+# array methods that transpilers map to non-godot collections as well
+LOCAL_ARRAY_METHODS = ('append', 'push_back', 'size', 'has', 'clear')
+
+# operators of statements assigning a variable
+ASSIGNMENT_OPERATORS = ('=', '+=', '-=', '*=', '/=', '%=', '**=', '&=', '|=', '^=', '<<=', '>>=')
+
+# evaluate arithmetic on literals and hoist constant constructors in methods (set by main.py)
+fold_constants = False
+
+# value types whose constructors are hoisted when their params are constant
+HOISTED_CONSTRUCTORS = ('Vector2', 'Vector2i', 'Vector3', 'Vector3i', 'Vector4', 'Vector4i',
+	'Color', 'Rect2', 'Rect2i', 'Quaternion', 'Plane', 'AABB', 'Basis', 'Transform2D', 'Transform3D')
+
+GLOBAL_CONSTANTS = { 'PI':math.pi, 'TAU':math.tau }
 
 
 # recursive descent parser
 class Parser:
 	
 	def __init__(self, filename, text, transpiler, vprint):
-		# keep track of the script being transpiled
-		self.script_name = filename
-		
 		# transpiler renamed 'out' for brevity
 		self.out = transpiler
 		
@@ -26,8 +52,20 @@ class Parser:
 		
 		# generator that splits text into tokens
 		self.tokenizer = Tokenizer()
+		
+		self.reset(filename, text)
+	
+	# prepare the parser for another script
+	# NOTE: allows to reuse a parser for batches of files
+	def reset(self, filename, text):
+		# keep track of the script being transpiled
+		self.script_name = filename
+		
 		self.tokens = self.tokenizer.tokenize(text + '\n')
 		
+		# tokens read ahead by peek()
+		self.lookahead = []
+		
 		# update current token
 		self.advance()
 		
@@ -46,6 +84,53 @@ class Parser:
 
 		# in a subexpression "(<expression>)"
 		self.in_subexpression = False
+		
+		# node fields (class_name:{node_path:field_name})
+		self.node_fields = {}
+		# property whose getter or setter is being parsed
+		self.accessed_property = None
+		
+		# the code being parsed can use node fields
+		self.caching_nodes = False
+		# (first token, following token, node path) of the last parsed node lookup
+		self.node_span = None
+		
+		# declared type of the collection literal being assigned
+		self.expected_type = None
+		# (first token, following token) of the last parsed array literal
+		self.array_span = None
+		# typed array locals of the method being parsed (name:only used locally)
+		self.local_arrays = None
+		# locals of the method being parsed known to stay local (from the type resolving step)
+		self.method_lists = set()
+		# the array literal being assigned can be a non-godot collection
+		self.expected_list = False
+		
+		# types assigned to the locals declared without type nor value, in the method being parsed
+		# ({name:(declaration_level, {type})}, None outside methods)
+		self.variant_locals = None
+		# local being assigned by the current statement (not a read)
+		self.assigned_local = None
+		# parsing the iterated expression of a for loop
+		self.iterating = False
+		# parsing the body of a loop
+		self.in_loop = False
+		# parsing a method body
+		self.in_method = False
+		# locals visible to the lambda being parsed, that it would capture (name:type)
+		self.lambda_outer_locals = None
+		# the lambda being parsed uses locals, members or methods from its context
+		self.lambda_captures = False
+		# the lambda being parsed reads values of unknown type, so its return type is unknown too
+		self.lambda_variants = False
+		
+		# value of the last parsed expression if it is constant, else None
+		# NOTE: EMPTY for the missing operand of unary operators (ex: -1)
+		self.constant = None
+		# constructors hoisted from the method being parsed ((name, params):(field, assignment))
+		self.method_constants = None
+		# number of hoisted constructors (class_name:count)
+		self.constants_count = {}
 	
 	""" SCRIPT/STATEMENT GRAMMAR 
 	
@@ -213,17 +298,94 @@ class Parser:
 		
 		self.expect(':')
 		
+		# node fields are assigned in _ready, so they can't be used before
+		# NOTE: limited to script classes, since C# misplaces the _ready of inner classes
+		cache_nodes = cache_node_paths and not static and len(self.classes) == 1 \
+			and name not in ('_init', '_enter_tree')
+		if cache_nodes: self.declareNodeFields()
+		self.caching_nodes = cache_nodes
+		
+		self.local_arrays = {}
+		self.method_lists = local_lists.get((self.getClassName(), name), set())
+		self.variant_locals = {}
+		self.method_constants = {} if fold_constants else None
+		
 		# make transpiler write to a buffer
 		# so we can parser block code, emit declaration then emit block code
 		self.out.addLayer()
+		self.in_method = True
 		blockType = self.Block()
+		self.in_method = False
 		code = self.out.popLayer()
 		
+		# arrays that never leave the method can use non-godot collections
+		local_lists[(self.getClassName(), name)] = { local for local, stays in self.local_arrays.items() if stays }
+		self.local_arrays = None
+		self.method_lists = set()
+		
+		# locals every assignment agrees on the type of
+		narrowed = { name:types.pop() for name, (_, types) in self.variant_locals.items() \
+			if len(types) == 1 and None not in types and 'Variant' not in types }
+		if narrowed: code = self.out.narrow_locals(code, narrowed)
+		self.variant_locals = None
+		
+		self.caching_nodes = False
+		
+		if self.method_constants:
+			for (type, *_), (field, value) in self.method_constants.items():
+				self.out.declare_constant(type, field, value)
+		self.method_constants = None
+		
 		returnType = returnType or blockType
 		self.getClass().methods[name] = returnType
 		override = not static and name in self.getClassParent().methods
+		virtual = not static and not override and name in overridden_methods.get(self.getClassName(), ())
+		
+		self.out.define_method(name, params, params_init, returnType, code, static, override, virtual)
+	
+	# get_node("<path>"), or a field holding its result when caching node paths
+	def getNode(self, path):
+		self.lambda_captures = True
+		if self.caching_nodes: node_paths.setdefault(self.getClassName(), {}).setdefault(path, None)
+		
+		field = self.caching_nodes and self.node_fields[self.getClassName()].get(path)
+		if field: self.out.property(field)
+		else: self.out.getNode(path, 'Node')
+	
+	# type of the node lookup, typed when a field caches it
+	def nodeType(self, path):
+		cached = self.caching_nodes and path in self.node_fields[self.getClassName()]
+		return cached and node_paths[self.getClassName()][path] or 'Node'
+	
+	# a typed variable holding the node types the field caching it
+	# NOTE: lookups typed differently fall back to Node
+	def hintNodeType(self, path, type):
+		paths = node_paths.get(self.getClassName(), {})
+		if not self.caching_nodes or path not in paths: return
+		paths[path] = type if paths[path] in (None, type) else 'Node'
+	
+	# declare the node fields of the class, gathered by the type resolving step
+	# NOTE: once, before the first method where they can be used
+	# since they are assigned in _ready, that may be defined by any method after
+	def declareNodeFields(self):
+		if self.getClassName() in self.node_fields: return
+		fields = self.node_fields[self.getClassName()] = {}
+		
+		def get_node(path, type):
+			yield type
+			self.out.getNode(path, type)
+			yield
 		
-		self.out.define_method(name, params, params_init, returnType, code, static, override)
+		for path, type in node_paths.get(self.getClassName(), {}).items():
+			field = '_' + '_'.join(re.findall(r'\w+', path.lower())) + '_node'
+			while field in fields.values() or field in self.getClass().members: field += '_'
+			fields[path] = field
+			
+			type = type or 'Node'
+			assignment = get_node(path, type); next(assignment)
+			self.out.declare_property(type, field, assignment, None, False, False, True)
+			self.out.end_statement()
+			self.out += '\n'
 	
 	
 	def Block(self):
@@ -256,8 +418,8 @@ class Parser:
 		elif self.expect('var'): return self.declare(flags=self.DECL_FLAGS.none) or self.out.end_statement()
 		elif self.expect('const'): return self.declare(flags=self.DECL_FLAGS.constant) or self.out.end_statement()
 		elif self.expect('if'): return self.ifStmt()
-		elif self.expect('while'): return self.whileStmt()
-		elif self.expect('for'): return self.forStmt()
+		elif self.expect('while'): return self.loop(self.whileStmt)
+		elif self.expect('for'): return self.loop(self.forStmt)
 		elif self.expect('match'): return self.matchStmt()
 		elif self.expect('return'):return self.returnStmt()
 		elif self.expect('await'): return self.awaitStmt()
@@ -288,6 +450,18 @@ class Parser:
 
 		return type
 	
+	# outermost loops are buffered so the transpiler can move code before them
+	def loop(self, statement):
+		if self.in_loop: return statement()
+		
+		self.in_loop = True
+		self.out.addLayer()
+		type = statement()
+		self.out.write(self.out.hoist_invariants(self.out.popLayer()))
+		self.in_loop = False
+		
+		return type
+	
 	def whileStmt(self):
 		cond = self.boolean(); next(cond)
 		self.out.whileStmt(cond)
@@ -303,8 +477,21 @@ class Parser:
 		
 		self.expect('in')
 		
+		# range loops are emitted as counted loops
+		if self.match_value('range') and getattr(self.peek(), 'value', None) == '(':
+			self.advance(); self.advance()
+			params = ( *self.parseCallParams() ,)
+			
+			self.locals[name] = iterator_type = iterator_type or 'int'
+			self.out.forRangeStmt(name, iterator_type, params)
+			
+			self.expect(':')
+			return self.Block()
+		
+		self.iterating = True
 		exp = self.expression()
 		exp_type = next(exp)
+		self.iterating = False
 
 		inner_type = (exp_type.replace('[]', '') if exp_type and exp_type != 'Array' else 'Variant')
 		iterator_type = iterator_type or inner_type
@@ -364,12 +551,13 @@ class Parser:
 		# NOTE: not that portable
 		# but c++ has no equivalent anyway afaik
 		self.out.addLayer()
-		exp = self.expression(); next(exp); next(exp)
+		exp = self.expression(); type = next(exp); next(exp)
 		exp_str = self.out.popLayer()
 		splitExpr = exp_str.rsplit('.', 1)
 		object = splitExpr[0] if len(splitExpr) > 1 else 'self'
 		signalName = splitExpr[-1]
-		self.out.awaitStmt(object, signalName)
+		owner = self.signalOwner(type) if type and type.endswith('signal') else None
+		self.out.awaitStmt(object, signalName, owner)
 		
 	
 	def declare(self, name = None, flags = DECL_FLAGS.none):
@@ -382,17 +570,34 @@ class Parser:
 		
 		# parsing assignment if needed
 		ass = None
+		local_array = False
+		local_list = False
 		if self.expect('='):
+			start = self.current
+			# typed collection literals
+			if type and (type.endswith('[]') or type.startswith('Dictionary<')):
+				self.expected_type = type
+				self.expected_list = local_list = name in self.method_lists
 			ass = self.expression()
 			ass_type = next(ass)
+			if type and self.node_span and self.node_span[:2] == (start, self.current) and inherits(type, 'Node'):
+				self.hintNodeType(self.node_span[2], type)
 			type = type or ass_type
+			# only initialized with a typed array literal
+			local_array = bool(type) and type.endswith('[]') and self.array_span == (start, self.current)
 		
 		type = type or 'Variant'
 		
 		# emit code
 		if not flags & self.DECL_FLAGS.property:
+			if self.local_arrays != None:
+				self.local_arrays[name] = local_array and name not in self.local_arrays
+			# NOTE: narrowing is done per name, so redeclared names stay Variant
+			if self.variant_locals != None and not ass and type == 'Variant':
+				self.variant_locals[name] = (self.level, set() if name not in self.variant_locals else {'Variant'})
 			self.locals[name] = type
-			self.out.declare_variable(type, name, ass)
+			if local_list: self.out.declare_list(type, name, ass)
+			else: self.out.declare_variable(type, name, ass)
 
 		else:
 			self.getClass().members[name] = type
@@ -429,7 +634,9 @@ class Parser:
 							
 							elif self.expect(':'):
 								self.out.addLayer()
+								self.accessed_property = name
 								self.Block()
+								self.accessed_property = None
 								code = self.out.popLayer()
 								yield 'getter', code
 						
@@ -440,7 +647,9 @@ class Parser:
 							elif self.expect('('):
 								valueName = self.consume(); self.expect(')', ':')
 								self.out.addLayer()
+								self.accessed_property = name
 								self.Block()
+								self.accessed_property = None
 								code = self.out.popLayer()
 								yield 'setter', valueName, code
 						
@@ -454,12 +663,26 @@ class Parser:
 	def reassign(self):
 		# NOTE: expression() handles function calls and modification operators (a += b)
 		# even though it is not conceptually correct
-		exp = self.expression(); next(exp)
+		# local assigned as a whole (ex: x = 1, x += 1)
+		target = self.current.value if self.match_type('TEXT') \
+			and getattr(self.peek(), 'value', None) in ASSIGNMENT_OPERATORS else None
+		
+		self.assigned_local = target if getattr(self.peek(), 'value', None) == '=' else None
+		exp = self.expression(); exp_type = next(exp)
+		self.assigned_local = None
 		if self.expect('='):
 			self.endline()
-			ass = self.expression(); next(ass)
+			ass = self.expression(); ass_type = next(ass)
 			next(exp); self.out.assignment(ass)
-		else: next(exp)
+		else:
+			# NOTE: modification operators yield the type of their value
+			next(exp); ass_type = exp_type
+		
+		if self.variant_locals and target in self.variant_locals:
+			level, types = self.variant_locals[target]
+			# the first assignment has to happen before any read, in the block of the declaration
+			if not types and level != self.level: types.add('Variant')
+			types.add(ass_type)
 		self.out.end_statement()
 	
 	
@@ -491,11 +714,16 @@ class Parser:
 	def expression(self):
 		exp = self.ternary()
 		type = next(exp)
-		# NOTE: type casting will work in C# with a as keyword, but wont with c++
-		# TBD if we need to do something here
-		if self.expect('as'): type = self.parseType()
-		yield type
-		next(exp)
+		cast = self.expect('as') and self.parseType()
+		
+		# object casts are kept, so that calls on the result are dispatched directly
+		# NOTE: other casts rely on implicit conversions
+		if cast and inherits(cast, 'Object'):
+			yield cast
+			self.out.cast(exp, type, cast)
+		else:
+			yield cast or type
+			next(exp)
 		yield
 	
 	def ternary(self):
@@ -506,6 +734,7 @@ class Parser:
 			self.expect('else')
 			valFalse = self.ternary()
 			valFalse_type = next(valFalse)
+			self.constant = None
 			yield valTrue_type or valFalse_type
 			self.out.ternary(cond, valTrue, valFalse)
 		else:
@@ -524,6 +753,7 @@ class Parser:
 		if op:
 			ar2 = self.boolean()
 			ar_type = next(ar2)
+			self.constant = None
 			yield 'bool'
 			next(ar1)
 			self.out.operator(op)
@@ -532,6 +762,7 @@ class Parser:
 		# handling type checks here
 		elif self.expect('is'):
 			checked = self.parseType()
+			self.constant = None
 			yield 'bool'
 			self.out.check_type(ar1, checked)
 
@@ -541,6 +772,7 @@ class Parser:
 			if negative and not finished: print("unexpected 'not' :  ", self.current)
 			val = self.expression()
 			val_type = next(val)
+			self.constant = None
 			yield 'bool'
 			if negative: self.out.operator('not')
 			next(val)
@@ -558,15 +790,25 @@ class Parser:
 		pre_op = self.consume() if self.match_type('UNARY') else None
 		
 		ar = self._arithmetic()
-		yield next(ar);
+		type = next(ar)
+		if pre_op: self.constant = None
+		yield type
 		if pre_op: self.out.operator(pre_op)
 		next(ar)
 		yield
 	
 	
-	def _arithmetic(self):
-		val1 = self.dereference()
+	# NOTE: chain holds the operands constants and operators of the whole expression
+	# (ex: [1, '+', 2, '*', PI]) since it's parsed right to left
+	def _arithmetic(self, chain = None):
+		# string formatting is lowered, instead of a % operation on a string
+		formatting = self.match_type('STRING') and getattr(self.peek(), 'value', None) == '%'
+		val1 = self.stringFormat() if formatting else self.dereference()
 		type = next(val1)
+		
+		top = chain == None
+		if top: chain = []
+		chain.append(self.constant)
 
 		self.subexpression_endline()
 		
@@ -574,9 +816,21 @@ class Parser:
 		# which is not exact but simpler to do this way
 		op = self.consume() if self.match_type('ARITHMETIC') else None
 		
+		# reassignment value is a separate expression
+		reassignment = op and op.endswith('=')
+		if op and not reassignment: chain.append(op)
+		
 		if op:
-			val2 = self._arithmetic()
+			val2 = self._arithmetic(None if reassignment else chain)
 			type = next(val2)
+		
+		folded = foldConstants(chain) if fold_constants and top and len(chain) > 1 else None
+		if folded != None:
+			self.constant = folded
+			yield 'int' if isinstance(folded, int) else 'float'
+			self.out.literal(folded)
+		elif op:
+			if top: self.constant = None
 			yield type
 			next(val1)
 			self.out.operator(op)
@@ -587,6 +841,32 @@ class Parser:
 		yield
 	
 
+	# "<format>" % <value> or "<format>" % [<values>]
+	def stringFormat(self):
+		format = self.consume(); self.advance()
+		
+		if self.expect('['):
+			values, val_type = [], None
+			self.out.addLayer(); self.endline()
+			for _ in self.doWhile(lambda: not self.expect(']')):
+				val = self.expression(); next(val)
+				values.append(val)
+				self.expect(','); self.endline()
+			self.out.popLayer()
+		else:
+			val = self.dereference(); val_type = next(val)
+			values = [val]
+		
+		self.constant = None
+		yield 'string'
+		
+		# the values of an array only known at runtime can't be spread
+		if len(values) == 1 and val_type and (val_type == 'Array' or val_type.endswith('[]')):
+			self.out.string_format_array(format, val)
+		else:
+			self.out.string_format(format, values)
+		yield
+	
 	def dereference(self):
 		val = self.value()
 		type = next(val)
@@ -598,14 +878,18 @@ class Parser:
 		# reference
 		if self.expect('.'):
 			ref = self.reference(type, singleton)
-			yield next(ref)
+			ref_type = next(ref)
+			self.constant = None
+			yield ref_type
 			if not signal: next(val)
 			next(ref)
 		
 		# subscription
 		elif self.expect('['):
 			sub = self.subscription(type)
-			yield next(sub)
+			sub_type = next(sub)
+			self.constant = None
+			yield sub_type
 			next(val); next(sub)
 
 		# no dereferencing
@@ -621,15 +905,22 @@ class Parser:
 
 		self.subexpression_endline()
 		
+		start = self.current
+		expected_type, self.expected_type = self.expected_type, None
+		expected_list, self.expected_list = self.expected_list, False
+		self.constant = None
+		
 		# int and hexadecimals are supported as-is by cpp and C#
 		if self.match_type('INT') or self.match_type('HEX'):
 			val = self.consume()
+			self.constant = int(val, 16) if val[1:2] in ('x', 'X') else int(val)
 			yield 'int'
 			self.out.literal(val)
 			
 		# float
 		elif self.match_type('FLOAT'):
 			val = float(self.consume())
+			self.constant = val
 			yield 'float'
 			self.out.literal(val)
 			
@@ -648,6 +939,7 @@ class Parser:
 		# "" or '' string
 		elif self.match_type('STRING'):
 			val = self.consume()
+			self.constant = val
 			yield 'string'
 			self.out.string(val)
 		
@@ -664,8 +956,12 @@ class Parser:
 				self.expect(','); self.endline()
 			contents = self.out.popLayer()
 			self.out.level -= 1
-			yield 'Array'
-			self.out.create_array(contents)
+			self.constant = None
+			self.array_span = (start, self.current)
+			type = expected_type if expected_type and expected_type.endswith('[]') else None
+			yield type or 'Array'
+			if type and expected_list: self.out.create_list(contents, type)
+			else: self.out.create_array(contents, type)
 			
 		# dictionary
 		elif self.expect('{'):
@@ -678,8 +974,10 @@ class Parser:
 				self.expect(','); self.endline()
 			contents = self.out.popLayer()
 			self.out.level -= 1
-			yield 'Dictionary'
-			self.out.create_dict(contents)
+			self.constant = None
+			type = expected_type if expected_type and expected_type.startswith('Dictionary<') else None
+			yield type or 'Dictionary'
+			self.out.create_dict(contents, type)
 			
 		# subexpression : (expression)
 		elif self.expect('('):
@@ -692,20 +990,19 @@ class Parser:
 			self.expect(')')
 			if not sub_subexpression:
 				self.in_subexpression = False
+			# folded expressions don't need parenthesis
+			folded = fold_constants and isNumber(self.constant)
 			yield enclosed_type
-			self.out.subexpression(enclosed)
+			if folded: next(enclosed)
+			else: self.out.subexpression(enclosed)
 		
 		# get_node shortcuts : $node => get_node("node") -> Node
-		elif self.expect('$'):
-			name = self.consume()
-			yield 'Node'
-			self.out.call('Node', 'get_node', (passthrough(self.out.string, name) ,) )
-			
 		# scene-unique nodes : %node => get_node("%node") -> Node
-		elif self.expect('%'):
-			name = self.consume()
-			yield 'Node'
-			self.out.call('Node', 'get_node', (passthrough(self.out.string, f'%{name}') ,) )
+		elif self.match_value('$', '%'):
+			path = ('%' if self.consume() == '%' else '') + self.consume()
+			self.node_span = (start, self.current, path)
+			yield self.nodeType(path)
+			self.getNode(path)
 		
 		# lambda: func <name>?(params): <Block>
 		elif self.expect('func'):
@@ -714,13 +1011,27 @@ class Parser:
 			params, _ = self.parseParamDefinition()
 			self.expect(':')
 			self.expect_type('LINE_END')
+			# lambdas can be called at any time, so nodes aren't cached
+			caching_nodes, self.caching_nodes = self.caching_nodes, False
+			# track what the lambda captures
+			outer_locals, outer_captures, outer_variants = self.lambda_outer_locals, self.lambda_captures, self.lambda_variants
+			self.lambda_outer_locals = { k:v for k,v in self.locals.items() if k not in params }
+			self.lambda_captures = self.lambda_variants = False
+			# params and locals of the lambda are only visible in its body
+			locals = self.locals
+			self.locals = { **locals, **params }
 			self.out.addLayer()
-			_ret_type_ = self.Block()
+			return_type = self.Block()
 			code = self.out.popLayer()
-			# NOTE: we could use block's type inference
-			# but then we'd need special code for when lambda is called
+			self.locals = locals
+			if return_type and self.lambda_variants: return_type = 'Variant'
+			captures = self.lambda_captures
+			self.lambda_outer_locals, self.lambda_captures, self.lambda_variants = outer_locals, outer_captures or captures, outer_variants
+			self.caching_nodes = caching_nodes
+			self.constant = None
+			# NOTE: typed as Callable since that's how gdscript calls it
 			yield 'Callable'
-			self.out.create_lambda(params, code)
+			self.out.create_lambda(params, code, return_type, captures, self.in_method)
 		
 		# variable name
 		elif self.match_type('TEXT'):
@@ -731,14 +1042,38 @@ class Parser:
 			#this = name == 'self' and self.expect('.')
 			#if this: name = self.consume()
 			
+			# in its own accessors, self.<property> is the property itself, not its accessors
+			if name == 'self' and self.accessed_property and self.match_value('.') \
+				and getattr(self.peek(), 'value', None) == self.accessed_property:
+				self.advance(); name = self.consume()
+			
+			# user or engine class instantiation : Type.new() => constructor
+			# NOTE: typed, so that calls on the instance are dispatched directly
+			instantiation = name in godot_types and self.match_value('.') \
+				and getattr(self.peek(), 'value', None) == 'new'
+			if instantiation: self.expect('.', 'new')
+			
 			# call
 			if self.expect('('):
 				call = self.call(name)
-				yield next(call)
+				call_type = next(call)
+				self.constant = None
+				yield call_type
 				next(call)
 			
 			# variable
 			else:
+				# an untyped local read before being assigned stays Variant
+				if self.variant_locals and name in self.variant_locals and name != self.assigned_local:
+					level, types = self.variant_locals[name]
+					if not types: types.add('Variant')
+				
+				# a typed array local stays local if only indexed, iterated or modified in place
+				if self.local_arrays and self.local_arrays.get(name):
+					self.local_arrays[name] = self.match_value('[') \
+						or (self.iterating and self.match_value(':')) \
+						or (self.match_value('.') and getattr(self.peek(), 'value', None) in LOCAL_ARRAY_METHODS)
+				
 				# could be :
 				# a member (including signals)
 				# a local
@@ -762,6 +1097,14 @@ class Parser:
 					or (name if singleton or name in godot_types else None)
 
 				if singleton: type += 'singleton'
+				
+				if self.lambda_outer_locals != None and (property or name == 'self' or name in self.lambda_outer_locals):
+					self.lambda_captures = True
+				if self.lambda_outer_locals != None and type in (None, 'Variant'):
+					self.lambda_variants = True
+				
+				if name in GLOBAL_CONSTANTS and not (property or name in self.locals):
+					self.constant = GLOBAL_CONSTANTS[name]
 
 				yield type
 
@@ -769,7 +1112,10 @@ class Parser:
 				elif property: self.out.property(name)
 				else:          self.out.variable(name)
 
-		else: yield
+		# missing operand (ex: unary minus)
+		else:
+			self.constant = EMPTY
+			yield
 		yield
 
 
@@ -833,13 +1179,19 @@ class Parser:
 			else godot_types[GLOBALS].methods.get(name) if global_function \
 			else None)
 		
-		params = ( *self.parseCallParams() ,)
+		# methods of the class need the instance
+		if not (constructor or calling_type or global_function): self.lambda_captures = True
+		
+		constants = []
+		params = ( *self.parseCallParams(constants) ,)
+		hoisted = constructor and self.hoistConstructor(name, type, params, constants)
 		
 		# in case the expression continues
 		follows = self.referencesCallsAndSubscriptions(type)
 		yield next(follows)
 
-		if constructor: self.out.constructor(name, type, params)
+		if hoisted: self.out.property(hoisted)
+		elif constructor: self.out.constructor(name, type, params)
 		else: self.out.call(GLOBALS if global_function else calling_type, name, params)
 
 		next(follows)
@@ -865,11 +1217,11 @@ class Parser:
 		
 		# signal emission/connection
 		if type and type.endswith('signal'):
-			signal_name = type.replace('signal', '')
+			signal_name = type[:-len('signal')].split('.')[-1]
 			self.expect('('); params = ( *self.parseCallParams() ,)
 			yield None
 			if name == 'emit':
-				self.out.emitSignal(signal_name, params)
+				self.out.emitSignal(signal_name, params, self.signalOwner(type))
 			elif name == 'connect':
 				self.out.connectSignal(signal_name, params)
 
@@ -882,7 +1234,7 @@ class Parser:
 		
 		# other reference
 		elif self.expect('.'):
-			r = self.reference(member_type, singleton)
+			r = self.reference(f'{type}.{member_type}' if signal and type else member_type, singleton)
 			yield next(r)
 			emit()
 			next(r)
@@ -903,7 +1255,7 @@ class Parser:
 		
 		# end leaf
 		else:
-			if enum and type:
+			if (enum or signal) and type:
 				yield f'{type}.{member_type}'
 			else: yield member_type
 
@@ -924,7 +1276,7 @@ class Parser:
 		if class_name not in godot_types:
 			classData = ClassData()
 			classData.base = base_class
-			godot_types[class_name] = classData
+			add_types({class_name: classData})
 		
 		self.emit_class_change()
 		self.out.define_class(class_name, base_class, self.is_tool, is_main)
@@ -936,6 +1288,12 @@ class Parser:
 	
 	def getClassName(self): return  self.classes[-1]
 
+	# class defining a signal, signal types are qualified like enums (ex: SceneTree.process_framesignal)
+	# NOTE: unqualified signals are members of the current class or its parents
+	def signalOwner(self, signal_type):
+		owner = signal_type.rpartition('.')[0]
+		return owner or self.getClassName()
+
 	def emit_class_change(self):
 		self.out.current_class(self.getClassName(), self.getClass())
 	
@@ -949,17 +1307,42 @@ class Parser:
 		return parent
 	
 	# parse call params
-	def parseCallParams(self):
+	# NOTE: constants receives the params constant values
+	def parseCallParams(self, constants = None):
 		for _ in self.doWhile(lambda: not self.expect(')')):
-			exp = self.expression(); next(exp); yield exp
+			exp = self.expression(); next(exp)
+			if constants != None: constants.append(self.constant)
+			yield exp
 			self.expect(','); self.endline()
 	
+	# returns the name of the constant holding the constructed value
+	# if it can be built once for the whole method
+	def hoistConstructor(self, name, type, params, constants):
+		hoistable = self.method_constants != None and name in HOISTED_CONSTRUCTORS \
+			and all( isNumber(c) or isinstance(c, str) for c in constants )
+		if not hoistable: return None
+		
+		key = (name, *constants)
+		if key not in self.method_constants:
+			count = self.constants_count.get(self.getClassName(), 0)
+			self.constants_count[self.getClassName()] = count + 1
+			
+			def assignment():
+				yield type
+				self.out.constructor(name, type, params)
+				yield
+			value = assignment(); next(value)
+			
+			self.method_constants[key] = (f'{name.upper()}_CONST{count}', value)
+		
+		return self.method_constants[key][0]
+	
 	
 	""" parsing """
 	
 	def advance(self):
 		try:
-			self.current = next(self.tokens)
+			self.current = self.lookahead.pop() if self.lookahead else next(self.tokens)
 		except StopIteration as err:
 			# reached end of file
 			# using a trick to finish parsing
@@ -967,6 +1350,13 @@ class Parser:
 			self.current.type = 'EOF'
 			self.current.value = 'EOF'
 	
+	# token after the current one (None at end of file)
+	def peek(self):
+		if not self.lookahead:
+			try: self.lookahead.append(next(self.tokens))
+			except StopIteration: return None
+		return self.lookahead[0]
+	
 	# while implementation that avoids infinite loops
 	def doWhile(self, condition):
 		last = -1
@@ -1098,5 +1488,71 @@ class Parser:
 				else: self.out += '\n' * jumpedLines
 				break
 
+# missing operand marker
+EMPTY = object()
+
+def isNumber(value): return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+# gdscript operator precedence, from highest
+PRECEDENCE = ( ('*', '/', '%'), ('+', '-'), ('<<', '>>'), ('&',), ('^',), ('|',) )
+
+# evaluates a chain of constants and operators (ex: [1, '+', 2, '*', PI])
+# None if it can't be folded
+def foldConstants(chain):
+	values = []
+	operators = []
+	sign = 1
+	for i in range(0, len(chain), 2):
+		operand = chain[i]
+		op = chain[i+1] if i+1 < len(chain) else None
+		
+		# unary operator
+		if operand is EMPTY:
+			if op not in ('+', '-'): return None
+			if op == '-': sign = -sign
+			continue
+		
+		if not isNumber(operand): return None
+		values.append(sign * operand); sign = 1
+		if op: operators.append(op)
+	
+	if len(values) != len(operators) + 1: return None
+	if not all( any(op in level for level in PRECEDENCE) for op in operators ): return None
+	
+	for level in PRECEDENCE:
+		i = 0
+		while i < len(operators):
+			if operators[i] not in level: i += 1; continue
+			result = applyOperator(values[i], operators[i], values[i+1])
+			if result == None: return None
+			values[i:i+2] = [result]
+			del operators[i]
+	
+	result = values[0]
+	if isinstance(result, float) and not math.isfinite(result): return None
+	if isinstance(result, int) and not -2**63 <= result < 2**63: return None
+	return result
+
+# c-like semantics, like gdscript
+def applyOperator(a, op, b):
+	integers = isinstance(a, int) and isinstance(b, int)
+	if op == '+': return a + b
+	if op == '-': return a - b
+	if op == '*': return a * b
+	if op in ('/', '%') and b == 0: return None
+	if op == '/':
+		if not integers: return a / b
+		quotient = abs(a) // abs(b)
+		return quotient if (a < 0) == (b < 0) else -quotient
+	# remaining operators only accept integers
+	if not integers: return None
+	if op == '%': return abs(a) % abs(b) * (-1 if a < 0 else 1)
+	if op in ('<<', '>>') and not 0 <= b < 64: return None
+	if op == '<<': return a << b
+	if op == '>>': return a >> b
+	if op == '&': return a & b
+	if op == '^': return a ^ b
+	if op == '|': return a | b
+
 def passthrough(closure, *values):
 	closure(*values); yield
@@ -7,4 +7,9 @@ class StringBuilder(StringIO):
 		return self
 	
 	def __str__(self):
-		return self.getvalue()
\ No newline at end of file
+		return self.getvalue()
+	
+	# same interface as OutputStream
+	def lines(self):
+		self.seek(0)
+		yield from self
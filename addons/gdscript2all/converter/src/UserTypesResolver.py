@@ -4,6 +4,9 @@
 class Transpiler:
 	
 	def __init__(self):
+		self.reset()
+	
+	def reset(self, script_name = None, out_name = None):
 		# used directly in parser at some point
 		self.level = 0
 	
@@ -38,13 +41,16 @@ class Transpiler:
 	def setter(self, member, valueName, code):
 		pass
 	
-	def cleanGetSetCode(self, code, member):
-		pass
+	def declare_constant(self, type, name, value):
+		get(value)
 	
 	def declare_variable(self, type, name, assignment):
 		if assignment: get(assignment)
 	
-	def define_method(self, name, params = {}, params_init = {}, return_type = None, code = '', static = False, override = False):
+	def declare_list(self, type, name, assignment):
+		get(assignment)
+	
+	def define_method(self, name, params = {}, params_init = {}, return_type = None, code = '', static = False, override = False, virtual = False):
 		for i, (pName, pType) in enumerate(params.items()):
 			if pName in params_init:
 				self += ' = '; get(params_init[pName])
@@ -58,19 +64,28 @@ class Transpiler:
 	def subexpression(self, expression):
 		get(expression)
 	
-	def create_array(self, values):
+	def create_array(self, values, type = None):
+		pass
+	
+	def create_list(self, values, type):
 		pass
 
 	def array_item(self, item):
 		get(item)
 		
-	def create_dict(self, values):
+	def create_dict(self, values, type = None):
 		pass
 
+	def string_format_array(self, format, array):
+		get(array)
+	
+	def string_format(self, format, values):
+		for value in values: get(value)
+	
 	def dict_item(self, key, value):
 		get(key); get(value)
 	
-	def create_lambda(self, params, code):
+	def create_lambda(self, params, code, return_type, captures, in_method):
 		pass
 	
 	def literal(self, value):
@@ -109,6 +124,9 @@ class Transpiler:
 	def operator(self, op):
 		pass
 	
+	def cast(self, exp, type, cast):
+		get(exp)
+	
 	def check_type(self, exp, checked):
 		get(exp)
 	
@@ -133,19 +151,31 @@ class Transpiler:
 	def forStmt(self, name, type, exp):
 		get(exp)
 	
+	def forRangeStmt(self, name, type, params):
+		for p in params: get(p)
+	
+	def hoist_invariants(self, code):
+		return code
+	
 	def breakStmt(self):
 		pass
 	
 	def continueStmt(self):
 		pass
 	
-	def awaitStmt(self, object, signalName):
+	def awaitStmt(self, object, signalName, owner):
 		pass
 	
-	def emitSignal(self, name, params):
+	def emitSignal(self, name, params, owner):
 		for i, p in enumerate(params):
 			get(p)
 	
+	def narrow_locals(self, code, narrowed):
+		return code
+	
+	def getNode(self, path, type):
+		pass
+	
 	def connectSignal(self, name, params):
 		get(params[0])
 	
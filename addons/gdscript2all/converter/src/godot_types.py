@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache
 
 # small and fast serialization
 from pickle import dump as save, load
@@ -15,20 +16,38 @@ DOC_FOLDER = local_path + '/../../../../classData'
 godot_types = {}
 GLOBALS = '@GlobalScope'
 
+# classes of the godot api, as opposed to the user classes added later
+engine_types = set()
+
+# methods of user classes redefined by a user descendant ({class_name:{method_name}})
+# NOTE: the other methods can be dispatched statically
+overridden_methods = {}
+
 # variant types (names)
 variant_types = []
 
+# variant type constant by normalized type name Ex: { 'VECTOR2':'TYPE_VECTOR2' }
+variant_type_constants = {}
+
+# caches (functools.lru_cache) that depend on godot_types content
+# they are cleared whenever types are added
+type_caches = []
+
 def _import_type_definitions_():
 	global godot_types
+	global engine_types
 	global variant_types
+	global variant_type_constants
 	
 	# load class datas
 	with open(SAVEFILE, 'rb') as f:
 		godot_types = load(f)
+	engine_types = set(godot_types)
 	
 	# get variant type enum Ex: TYPE_FLOAT, TYPE_VECTOR2, etc
 	variant_types = [ cst for cst in godot_types['Variant'].enums.keys() if cst.startswith('TYPE_') and not cst.endswith('MAX')]
 	#print(variant_types)
+	variant_type_constants = { vt.replace('TYPE_', '', 1).replace('_','') : vt for vt in variant_types }
 
 	# decompression/flattening :
 	# add base class members to child class
@@ -147,6 +166,30 @@ def _update_type_definitions_():
 
 	print('updated godot type definitions')
 
+def add_types(types):
+	godot_types.update(types)
+	for cache in type_caches: cache.cache_clear()
+
+# build the override table, once every user class is known
+def build_override_table():
+	overridden_methods.clear()
+	for name in godot_types.keys() - engine_types:
+		methods = godot_types[name].methods
+		base = godot_types[name].base
+		while base in godot_types and base not in engine_types:
+			overridden_methods.setdefault(base, set()).update( m for m in methods if m in godot_types[base].methods )
+			base = godot_types[base].base
+
+# if type is base or one of its descendants
+# NOTE: cached since type translation asks it for every typed reference
+@lru_cache(maxsize=1024)
+def inherits(type, base):
+	while type in godot_types:
+		if type == base: return True
+		type = godot_types[type].base
+	return False
+type_caches.append(inherits)
+
 def add_function(name, return_type):
 	godot_types[GLOBALS].methods[name] = return_type
 
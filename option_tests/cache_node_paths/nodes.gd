@@ -0,0 +1,15 @@
+extends Node
+
+func _ready():
+	$Label.text = "ready"
+
+# lookups after _ready are cached too, typed by the variables holding them
+func _process(delta):
+	$Sprite.rotate(delta)
+	var label : Label = $Label
+	label.text = str(delta)
+	%Unique.queue_free()
+
+# lambdas can be called before _ready, so they don't use the fields
+func callback():
+	return func(): return $Label
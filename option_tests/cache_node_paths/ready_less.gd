@@ -0,0 +1,5 @@
+extends Node
+
+# _ready is created to assign the fields
+func hide_child():
+	$Child.hide()
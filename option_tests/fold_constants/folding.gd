@@ -0,0 +1,20 @@
+extends Node
+
+func folded(delta : float) -> float:
+	var seconds = 60 * 60 * 24
+	var angle = PI / 2. + TAU
+	var truncated = -7 / 2
+	var mixed = 2 + 3 * 4 - 1
+	var scaled = delta * (1. / 60.)
+	seconds += 1 + 2
+	return angle + seconds + truncated + mixed + scaled
+
+# only constant operands are folded
+func kept(value : int):
+	print(value * 2 + 1, value * (2 + 1))
+
+# value type constructors with constant params are built once
+func constructors(velocity : Vector2) -> Vector2:
+	var tint = Color("#ff0000")
+	print(tint)
+	return velocity * Vector2(0.5, 0.5) + Vector2(0.5, 0.5)
@@ -0,0 +1,19 @@
+extends Node
+
+var next_id = 0
+
+func get_next_id() -> int:
+	next_id += 1
+	return next_id
+
+# the getter changes a member : it stays in the loop
+func ids(n : int):
+	var out : Array[int] = []
+	for i in range(n):
+		out.append(get_next_id())
+	return out
+
+# the singleton is looked up once, the time is read at each iteration
+func wait(deadline : int):
+	while Time.get_ticks_msec() < deadline:
+		Engine.time_scale = 0.
@@ -0,0 +1,10 @@
+extends CharacterBody2D
+class_name Player
+
+signal died
+
+var health := 3
+
+func hit():
+	health -= 1
+	if health <= 0: died.emit()
@@ -0,0 +1,12 @@
+extends Node2D
+
+signal died
+
+var timer := Timer.new()
+
+# both scripts use the "died" StringName, guarded in the unity build
+func _ready():
+	add_child(timer)
+
+func despawn():
+	died.emit()
@@ -0,0 +1,30 @@
+extends Node
+
+var kept : Array[int] = []
+
+func local_only() -> int:
+	var ints : Array[int] = [1, 2]
+	ints.append(3)
+	var total := ints.size()
+	for i in ints:
+		total += i
+	ints[0] = total
+	return ints[0]
+
+# arrays leaving the method stay godot arrays
+func escaping() -> Array[String]:
+	var returned : Array[String] = ["a"]
+	var stored : Array[int] = []
+	kept = stored
+	var passed : Array[int] = [1]
+	print(passed)
+	return returned
+
+# a redeclared name stays a godot array
+func redeclared(flag : bool):
+	if flag:
+		var values : Array[int] = [1]
+		values.clear()
+	else:
+		var values : Array[int] = [2]
+		values.clear()
@@ -0,0 +1,43 @@
+extends Node
+
+# members, parameters and return values stay Array, they are shared by reference
+@export var weights : Array[float] = [0.5, 1.5]
+var scores : Array[int] = [1, 2]
+
+signal totals_changed(totals : Array[int])
+
+func add_to(a : Array[int]):
+	a.append(1)
+
+func add_score():
+	add_to(scores)
+
+func total(values : Array[int]) -> int:
+	var sum := 0
+	for value in values:
+		sum += value
+	return sum
+
+func squares(count : int) -> Array[int]:
+	var result : Array[int] = []
+	for i in range(count):
+		result.append(i * i)
+	return result
+
+# arrays that stay in their method are packed
+func sum_of_squares(count : int) -> int:
+	var values : Array[int] = []
+	for i in range(count):
+		values.append(i * i)
+	var sum := 0
+	for value in values:
+		sum += value
+	return sum
+
+func print_names():
+	var names : Array[String] = ["a", "b"]
+	# arrays of objects can't be packed
+	var nodes : Array[Node] = [self]
+	for name in names:
+		print(name)
+	print(nodes.size())
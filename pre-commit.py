@@ -1,5 +1,8 @@
 print("regenerating README")
+import os
+import sys
 from subprocess import run
+from tempfile import TemporaryDirectory
 
 def read_file(filename):
 	with open(filename, 'r') as f:
@@ -10,6 +13,27 @@ mainPath = 'addons/gdscript2all/converter/main.py'
 run(['python', mainPath])
 run(['python', mainPath, '-t', 'Cpp'])
 
+# option tests : option_tests/<option>/ is transpiled with --<option> into results/options/<option>/
+option_tests = {
+	'hoist_invariants': ('Cpp',),
+	'cache_node_paths': ('CSharp', 'Cpp'),
+	'use_lists': ('CSharp',),
+	'fold_constants': ('CSharp', 'Cpp'),
+	'use_packed_arrays': ('Cpp',),
+	'unity_build': ('Cpp',),
+}
+for option, transpilers in option_tests.items():
+	for transpiler in transpilers:
+		run(['python', mainPath, f'option_tests/{option}', '-o', f'results/options/{option}', '-t', transpiler, f'--{option}'])
+
+# streamed output must be the same as the output built in memory
+with TemporaryDirectory() as streamed:
+	run(['python', mainPath, '-o', streamed, '--stream_output'])
+	run(['python', mainPath, '-o', streamed, '-t', 'Cpp', '--stream_output'])
+	different = [ filename for filename in sorted(os.listdir(streamed)) \
+		if read_file(os.path.join(streamed, filename)) != read_file(os.path.join('results', filename)) ]
+	if different: sys.exit(f'--stream_output differs from the regular output for: {", ".join(different)}')
+
 template = read_file('README_TEMPLATE.md')
 
 transforms = {
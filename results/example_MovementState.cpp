@@ -5,30 +5,6 @@
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
 
-void MovementState::set_acceleration(double value) {
-	acceleration = value;
-}
-
-double MovementState::get_acceleration() {
-	return acceleration;
-}
-
-void MovementState::set_nimbleness(double value) {
-	nimbleness = value;
-}
-
-double MovementState::get_nimbleness() {
-	return nimbleness;
-}
-
-void MovementState::set_top_speed(double value) {
-	top_speed = value;
-}
-
-double MovementState::get_top_speed() {
-	return top_speed;
-}
-
 void MovementState::_bind_methods() {
 	ClassDB::bind_method(D_METHOD("set_acceleration", "value"), &MovementState::set_acceleration);
 	ClassDB::bind_method(D_METHOD("get_acceleration"), &MovementState::get_acceleration);
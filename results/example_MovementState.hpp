@@ -25,12 +25,12 @@ protected:
 	double top_speed;
 
 public:
-	void set_acceleration(double value);
-	double get_acceleration();
-	void set_nimbleness(double value);
-	double get_nimbleness();
-	void set_top_speed(double value);
-	double get_top_speed();
+	void set_acceleration(double value) { acceleration = value; }
+	double get_acceleration() { return acceleration; }
+	void set_nimbleness(double value) { nimbleness = value; }
+	double get_nimbleness() { return nimbleness; }
+	void set_top_speed(double value) { top_speed = value; }
+	double get_top_speed() { return top_speed; }
 
 	static void _bind_methods();
 };
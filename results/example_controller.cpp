@@ -4,6 +4,13 @@
 #include <godot_cpp/core/object.hpp>
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
+#include <godot_cpp/classes/kinematic_collision3d.hpp>
+
+static const StringName &_sn_jump() { static const StringName name("jump"); return name; }
+static const StringName &_sn_movement() { static const StringName name("movement"); return name; }
+static const StringName &_sn_collision() { static const StringName name("collision"); return name; }
+static const StringName &_sn_changedState() { static const StringName name("changedState"); return name; }
+static const StringName &_sn_viewDirChanged() { static const StringName name("viewDirChanged"); return name; }
 
 void Character::_process(double delta)
 {
@@ -37,7 +44,7 @@ void Character::_process(double delta)
 	{
 		velocity.y += Math::max(MIN_JUMP_VELOCITY, ground_speed);
 		coyoteTime->stop();
-		emit_signal("jump", ground_speed);
+		emit_signal(_sn_jump(), ground_speed);
 	}
 
 	// when running, always go forward 
@@ -55,14 +62,37 @@ void Character::_process(double delta)
 
 	double new_ground_speed = calculate_ground_speed();
 
-	emit_signal("movement", local_dir, new_ground_speed);
+	emit_signal(_sn_movement(), local_dir, new_ground_speed);
 
 	move_and_slide();
 
-	for(int i=0; i<get_slide_collision_count(); i+=1)
+	for(int i=0, i_end=get_slide_collision_count(); i<i_end; i+=1)
+	{
+		emit_signal(_sn_collision(), get_slide_collision(i));
+	}
+}
+
+double Character::steepest_slope(Array normals)
+{
+	double steepest = 0.0;
+	for(Vector3 normal : normals)
+	{
+		double slope = normal.angle_to(get_floor_normal()) * Engine::get_singleton()->get_time_scale();
+		steepest = Math::max(steepest, slope);
+	}
+	return steepest;
+}
+
+int Character::pressed_actions(Array actions)
+{
+	int pressed = 0;
+	for(String action : actions)
 	{
-		emit_signal("collision", get_slide_collision(i));
+		if(Input::get_singleton()->is_action_pressed(action))
+		{pressed += 1;
+		}
 	}
+	return pressed;
 }
 
 void Character::set_movementState(Character::MovementEnum value)
@@ -70,14 +100,10 @@ void Character::set_movementState(Character::MovementEnum value)
 	if(movementState != value)
 	{
 		movementState = value;
-		emit_signal("changedState", movementState);
+		emit_signal(_sn_changedState(), movementState);
 	}
 }
 
-Character::MovementEnum Character::get_movementState() {
-	return movementState;
-}
-
 Vector3 Character::get_global_mov_dir()
 {return _global_mov_dir;
 }
@@ -109,30 +135,18 @@ void Character::set_view_dir(Vector3 value)
 {
 	view_dir = value;
 	view_dir.x = Math::clamp(view_dir.x,  - Globals.view_pitch_limit, Globals.view_pitch_limit);
-	emit_signal("viewDirChanged", view_dir);
-}
-
-Vector3 Character::get_view_dir() {
-	return view_dir;
-}
-
-void Character::set_movements(Array value) {
-	movements = value;
+	emit_signal(_sn_viewDirChanged(), view_dir);
 }
 
-Array Character::get_movements() {
-	return movements;
-}
-
-void Character::set_wantedMovement(Character::MovementEnum value) {
-	wantedMovement = value;
-}
-
-Character::MovementEnum Character::get_wantedMovement() {
-	return wantedMovement;
+Character::Character() :
+	coyoteTime(Utils.createTimer(this, 0.15)),
+	jumpCoolDown(Utils.createTimer(this, 0.15))
+{
 }
 
 void Character::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("steepest_slope", "normals"), &Character::steepest_slope);
+	ClassDB::bind_method(D_METHOD("pressed_actions", "actions"), &Character::pressed_actions);
 	ClassDB::bind_method(D_METHOD("calculate_ground_speed"), &Character::calculate_ground_speed);
 	ClassDB::bind_method(D_METHOD("set_movementState", "value"), &Character::set_movementState);
 	ClassDB::bind_method(D_METHOD("get_movementState"), &Character::get_movementState);
@@ -163,3 +177,4 @@ void Character::_bind_methods() {
 	ClassDB::add_signal(get_class_static(), MethodInfo("viewDirChanged", PropertyInfo(Variant::VECTOR3, "euler")));
 }
 
+double Character::gravity = 10.0;
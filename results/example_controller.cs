@@ -66,7 +66,7 @@ public partial class Character : Godot.CharacterBody3D
 		{
 			Velocity.Y += Mathf.Max(MIN_JUMP_VELOCITY, ground_speed);
 			CoyoteTime.Stop();
-			EmitSignal("Jump", ground_speed);
+			EmitSignal(SignalName.Jump, ground_speed);
 		}
 
 
@@ -85,16 +85,39 @@ public partial class Character : Godot.CharacterBody3D
 
 		var new_ground_speed = CalculateGroundSpeed();
 
-		EmitSignal("Movement", LocalDir, new_ground_speed);
+		EmitSignal(SignalName.Movement, LocalDir, new_ground_speed);
 
 		MoveAndSlide();
 
-		foreach(int i in GD.Range(GetSlideCollisionCount()))
+		for(int i = 0, i_end = GetSlideCollisionCount(); i < i_end; i += 1)
 		{
-			EmitSignal("Collision", GetSlideCollision(i));
+			EmitSignal(SignalName.Collision, GetSlideCollision(i));
 		}
 	}
 
+	public double SteepestSlope(Array<Vector3> normals)
+	{
+		var steepest = 0.0;
+		foreach(Vector3 normal in normals)
+		{
+			var slope = normal.AngleTo(GetFloorNormal()) * Godot.Engine.TimeScale;
+			steepest = Mathf.Max(steepest, slope);
+		}
+		return steepest;
+	}
+
+	public int PressedActions(Array<String> actions)
+	{
+		var pressed = 0;
+		foreach(String action in actions)
+		{
+			if(Godot.Input.IsActionPressed(action))
+			{pressed += 1;
+			}
+		}
+		return pressed;
+	}
+
 
 	/* movement state / animations */
 	[Signal]
@@ -117,7 +140,7 @@ public partial class Character : Godot.CharacterBody3D
 			if(_MovementState != value)
 			{
 				_MovementState = value;
-				EmitSignal("ChangedState", _MovementState);
+				EmitSignal(SignalName.ChangedState, _MovementState);
 			}
 		}
 		get { return _MovementState; }
@@ -179,7 +202,7 @@ public partial class Character : Godot.CharacterBody3D
 		{
 			_ViewDir = value;
 			_ViewDir.X = Mathf.Clamp(_ViewDir.X,  - Globals.ViewPitchLimit, Globals.ViewPitchLimit);
-			EmitSignal("ViewDirChanged", _ViewDir);
+			EmitSignal(SignalName.ViewDirChanged, _ViewDir);
 		}
 		get { return _ViewDir; }
 	}
@@ -6,7 +6,6 @@
 #include <godot_cpp/variant/array.hpp>
 #include <godot_cpp/variant/dictionary.hpp>
 #include <godot_cpp/classes/character_body3d.hpp>
-#include <godot_cpp/classes/kinematic_collision3d.hpp>
 
 using namespace godot;
 
@@ -39,13 +38,16 @@ protected:
 
 	static double gravity;
 
-	Variant coyoteTime = Utils.createTimer(this, 0.15);
-	Variant jumpCoolDown = Utils.createTimer(this, 0.15);
-
-/* movement state / animations */
+	Variant coyoteTime;
+	Variant jumpCoolDown;
 
 public:
 	void _process(double delta) override;
+
+	double steepest_slope(Array normals);
+
+/* movement state / animations */
+	int pressed_actions(Array actions);
 	/* signal changedState(Ref<MovementEnum> state) */
 	/* signal collision(Ref<KinematicCollision3D> collision) */
 	/* signal movement(Vector3 dir, double speed) */
@@ -60,7 +62,7 @@ protected:
 
 public:
 	void set_movementState(Character::MovementEnum value);
-	Character::MovementEnum get_movementState();
+	Character::MovementEnum get_movementState() { return movementState; }
 
 protected:
 	Character::MovementEnum wantedMovement = MovementEnum::walk;
@@ -95,11 +97,12 @@ protected:
 
 public:
 	void set_view_dir(Vector3 value);
-	Vector3 get_view_dir();
-	void set_movements(Array value);
-	Array get_movements();
-	void set_wantedMovement(Character::MovementEnum value);
-	Character::MovementEnum get_wantedMovement();
+	Vector3 get_view_dir() { return view_dir; }
+	Character();
+	void set_movements(Array value) { movements = value; }
+	Array get_movements() { return movements; }
+	void set_wantedMovement(Character::MovementEnum value) { wantedMovement = value; }
+	Character::MovementEnum get_wantedMovement() { return wantedMovement; }
 
 	static void _bind_methods();
 };
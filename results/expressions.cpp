@@ -5,3 +5,57 @@
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
 
+expressions::expressions() :
+	array([]() {
+		static const Array _literal = []() {
+			Array _literal;
+			_literal.resize(3);
+			_literal[0] = 0;
+			_literal[1] = 1;
+			_literal[2] = 2;
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}()),
+	has_call(array.has(3)),
+	dict([]() {
+		static const Dictionary _literal = []() {
+			Dictionary _literal;
+			_literal[0] = 1;
+			_literal[1] = 2;
+			_literal[2] = 3;
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}()),
+	string_array([]() {
+		static const Array _literal = []() {
+			Array _literal;
+			_literal.resize(2);
+			_literal[0] = "0";
+			_literal[1] = "1";
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}()),
+	parenthesis((42)),
+	func_call(Math::sin(34)),
+	func_delayed(Math::exp(1, 2)),
+	dict_subscription(dict[0]),
+	typed_dict_subscription(typed_dict["0"]),
+	arithmetic(- i * 0.5),
+	comparison(arithmetic >= 0.5 && arithmetic == 6.0),
+	ternary(( true ? cond_true : cond_false )),
+	nested_ternary(( cond1 && 5 > 6 ? cond1_true * 3 : ( cond2 || (7 < 0) ? cond2_true | 4 : cond12_false && 0 ) )),
+	byte((bytes[6] & 0x0f) | 0x40),
+	multiline((_terminal_pad.length() && (!buffer_size || (_terminal_buffer[ - 1] != _terminal_pad)))),
+	formatted(vformat("%s: %d", str, byte)),
+	formatted_single(vformat("{%5.2f%%}", 0.5)),
+	formatted_padded(vformat("%-8s|%04d|%x", "name", 7, 255) + "!"),
+	formatted_array(String("%s %s") % string_array),
+	formatted_signed(vformat("%+d|%+05d|%+.1f", byte, byte, 0.5)),
+	formatted_dynamic(vformat("%*d", 4, byte))
+{
+}
+
+int expressions::i = 0;
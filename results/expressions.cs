@@ -18,8 +18,8 @@ public partial class expressions : Godot.Node
 	public Array Array = new Array{0, 1, 2, };
 	public bool HasCall = Array.Contains(3);
 	public Dictionary Dict = new Dictionary{{0, 1},{1, 2},{2, 3},};
-	public Array<String> StringArray = new Array{"0", "1", };
-	public Dictionary<String,int> TypedDict = new Dictionary{};
+	public Array<String> StringArray = new Array<String>{"0", "1", };
+	public Dictionary<String, int> TypedDict = new Dictionary<String, int>{};
 	public int Parenthesis = (42);
 	public int DelayedExpression = 1;
 	public double AsKeyword = 3;
@@ -47,4 +47,13 @@ public partial class expressions : Godot.Node
 	// and a comment
 	public bool Multiline = (_terminal_pad.Length() && (!buffer_size || (_terminal_buffer[ - 1] != _terminal_pad)));
 
+	// string formatting
+	public string Formatted = $"{Str}: {Byte}";
+	public string FormattedSingle = $"{{{0.5,5:F2}%}}";
+	public string FormattedPadded = $"{"name",-8}|{7:D4}|{255:x}" + "!";
+	public string FormattedArray = "%s %s" /* % StringArray : no C# equivalent to formatting with an array */;
+	public string FormattedSigned = $"{Byte:+0;-0}|{Byte:+0000;-0000}|{0.5:+0.0;-0.0}";
+	public string FormattedDynamic = "%*d" /* % new Array{4, Byte, } : no C# equivalent to these specifiers */;
+
+
 }
\ No newline at end of file
@@ -24,34 +24,45 @@ protected:
 ";
 	String escaped_str = "\n \\ \" ";
 	bool _protected_bool = true;
-	Array array = Array {/* initializer lists are unsupported */ 0, 1, 2,  };
-	bool has_call = array.has(3);
-	Dictionary dict = Dictionary {/* initializer lists are unsupported */ {0, 1},{1, 2},{2, 3}, };
-	Array string_array = Array {/* initializer lists are unsupported */ "0", "1",  };
-	Ref<Dictionary<String,int>> typed_dict = Dictionary();
-	int parenthesis = (42);
+	Array array;
+	bool has_call;
+	Dictionary dict;
+	Array string_array;
+	Dictionary typed_dict = Dictionary();
+	int parenthesis;
 	int delayed_expression = 1;
 	double asKeyword = 3;
 	Array array_of_enum;
-	double func_call = Math::sin(34);
+	double func_call;
 
 // comment \
-	double func_delayed = Math::exp(1, 2);
+	double func_delayed;
 
-	Variant dict_subscription = dict[0];
-	int typed_dict_subscription = typed_dict["0"];
+	Variant dict_subscription;
+	int typed_dict_subscription;
 
 // multi-part expressions
-	double arithmetic =  - i * 0.5;
-	bool comparison = arithmetic >= 0.5 && arithmetic == 6.0;
-	Variant ternary = ( true ? cond_true : cond_false );
-	int nested_ternary = ( cond1 && 5 > 6 ? cond1_true * 3 : ( cond2 || (7 < 0) ? cond2_true | 4 : cond12_false && 0 ) );
+	double arithmetic;
+	bool comparison;
+	Variant ternary;
+	int nested_ternary;
 
 // hexadecimal
-	int byte = (bytes[6] & 0x0f) | 0x40;
+	int byte;
 
 // and a comment
-	bool multiline = (_terminal_pad.length() && (!buffer_size || (_terminal_buffer[ - 1] != _terminal_pad)));
+	bool multiline;
+
+// string formatting
+	String formatted;
+	String formatted_single;
+	String formatted_padded;
+	String formatted_array;
+	String formatted_signed;
+	String formatted_dynamic;
+
+public:
+	expressions();
 };
 
 #endif // EXPRESSIONS_H
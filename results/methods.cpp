@@ -43,6 +43,91 @@ double methods::return_inference(double param)
 	return val * param;
 }
 
+int methods::typed_collections()
+{
+	Array ints = []() {
+		static const Array _literal = []() {
+			Array _literal;
+			_literal.resize(2);
+			_literal[0] = 1;
+			_literal[1] = 2;
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}();
+	ints.append(3);
+	return ints.size();
+}
+
+Array methods::lambdas(int offset)
+{
+	Callable doubled = [](int x) -> int 
+	{	return x * 2;
+	};
+	Callable shifted = [=](int x) -> int 
+	{	return x + offset;
+	};
+	Callable callback = [=]() 
+	{	returning(1.0);
+	};
+	Callable untyped = [](Variant a) -> Variant 
+	{	return a * 2;
+	};
+
+	// lambda params don't change the type of outer locals
+	String x = "s";
+	Callable same_x = [](int x) -> int 
+	{	return x;
+	};
+	String y = x;
+	return [&]() {
+		Array _literal;
+		_literal.resize(6);
+		_literal[0] = doubled;
+		_literal[1] = shifted;
+		_literal[2] = callback;
+		_literal[3] = untyped;
+		_literal[4] = same_x;
+		_literal[5] = y;
+		return _literal;
+	}();
+}
+
+Variant methods::narrowing(bool flag)
+{
+	int count;
+	count = 0;
+	if(flag)
+	{count += 1;
+	}
+	Variant mixed;
+	mixed = 1;
+	mixed = "one";
+	return count;
+}
+
+Variant methods::narrowing_scopes(bool flag)
+{
+	if(flag)
+	{
+		Variant y;
+		y = 1;
+	}
+	else
+	{
+		Variant y;
+		y = "s";
+	}
+	Variant read_first;
+	UtilityFunctions::print(read_first);
+	read_first = 1;
+	Variant assigned_in_branch;
+	if(flag)
+	{assigned_in_branch = 1;
+	}
+	return assigned_in_branch;
+}
+
 void methods::_bind_methods() {
 	ClassDB::bind_method(D_METHOD("empty"), &methods::empty);
 	ClassDB::bind_method(D_METHOD("reassign"), &methods::reassign);
@@ -51,6 +136,10 @@ void methods::_bind_methods() {
 	ClassDB::bind_method(D_METHOD("returning", "v"), &methods::returning);
 	ClassDB::bind_method(D_METHOD("declare"), &methods::declare);
 	ClassDB::bind_method(D_METHOD("return_inference", "param"), &methods::return_inference);
+	ClassDB::bind_method(D_METHOD("typed_collections"), &methods::typed_collections);
+	ClassDB::bind_method(D_METHOD("lambdas", "offset"), &methods::lambdas);
+	ClassDB::bind_method(D_METHOD("narrowing", "flag"), &methods::narrowing);
+	ClassDB::bind_method(D_METHOD("narrowing_scopes", "flag"), &methods::narrowing_scopes);
 
 }
 
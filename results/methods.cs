@@ -46,4 +46,77 @@ public partial class methods : Godot.Node
 		return val * param;
 	}
 
+	public int TypedCollections()
+	{
+		var ints = new Array<int>{1, 2, };
+		ints.Add(3);
+		return ints.Count;
+	}
+
+	private static readonly System.Func<int, int> _Lambda0 = (int x) =>
+	{	return x * 2;
+	};
+
+	private static readonly System.Func<Godot.Variant, Godot.Variant> _Lambda1 = (Godot.Variant a) =>
+	{	return a * 2;
+	};
+
+	private static readonly System.Func<int, int> _Lambda2 = (int x) =>
+	{	return x;
+	};
+
+	public Array Lambdas(int offset)
+	{
+		var doubled = _Lambda0;
+		var shifted = (int x) =>
+		{	return x + offset;
+		};
+		var callback = () =>
+		{	Returning(1.0);
+		};
+		var untyped = _Lambda1;
+
+		// lambda params don't change the type of outer locals
+		var x = "s";
+		var same_x = _Lambda2;
+		var y = x;
+		return new Array{doubled, shifted, callback, untyped, same_x, y, };
+	}
+
+	public Godot.Variant Narrowing(bool flag)
+	{
+		int count;
+		count = 0;
+		if(flag)
+		{count += 1;
+		}
+		Godot.Variant mixed;
+		mixed = 1;
+		mixed = "one";
+		return count;
+	}
+
+	public Godot.Variant NarrowingScopes(bool flag)
+	{
+		if(flag)
+		{
+			Godot.Variant y;
+			y = 1;
+		}
+		else
+		{
+			Godot.Variant y;
+			y = "s";
+		}
+		Godot.Variant read_first;
+		GD.Print(read_first);
+		read_first = 1;
+		Godot.Variant assigned_in_branch;
+		if(flag)
+		{assigned_in_branch = 1;
+		}
+		return assigned_in_branch;
+	}
+
+
 }
\ No newline at end of file
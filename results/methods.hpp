@@ -29,6 +29,14 @@ public:
 
 	double return_inference(double param = 5.0);
 
+	int typed_collections();
+
+	Array lambdas(int offset);
+
+	Variant narrowing(bool flag);
+
+	Variant narrowing_scopes(bool flag);
+
 	static void _bind_methods();
 };
 
@@ -0,0 +1,36 @@
+
+#include "nodes.hpp"
+
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+#include <godot_cpp/classes/label.hpp>
+
+void nodes::_ready()
+{
+	_label_node = get_node<Label>("Label");
+	_sprite_node = get_node("Sprite");
+	_unique_node = get_node("%Unique");
+	_label_node->set_text("ready");
+}
+
+void nodes::_process(Variant delta)
+{
+	_sprite_node->rotate(delta);
+	Label* label = _label_node;
+	label->set_text(str(delta));
+	_unique_node->queue_free();
+}
+
+Callable nodes::callback()
+{
+	return [=]() -> Node* 
+	{	return get_node("Label");
+	};
+}
+
+void nodes::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("callback"), &nodes::callback);
+
+}
+
@@ -0,0 +1,38 @@
+using Godot;
+using Godot.Collections;
+
+[GlobalClass]
+public partial class nodes : Godot.Node
+{
+	protected Godot.Label _LabelNode;
+	protected Godot.Node _SpriteNode;
+	protected Godot.Node _UniqueNode;
+	public override void _Ready()
+	{
+		_LabelNode = GetNode<Godot.Label>("Label");
+		_SpriteNode = GetNode("Sprite");
+		_UniqueNode = GetNode("%Unique");
+		_LabelNode.Text = "ready";
+	}
+
+
+	// lookups after _ready are cached too, typed by the variables holding them
+	public override void _Process(Godot.Variant delta)
+	{
+		_SpriteNode.Rotate(delta);
+		var label = _LabelNode;
+		label.Text = Str(delta);
+		_UniqueNode.QueueFree();
+	}
+
+
+	// lambdas can be called before _ready, so they don't use the fields
+	public Callable Callback()
+	{
+		return () =>
+		{	return GetNode("Label");
+		};
+	}
+
+
+}
\ No newline at end of file
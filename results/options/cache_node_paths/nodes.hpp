@@ -0,0 +1,38 @@
+
+#ifndef NODES_H
+#define NODES_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/classes/node.hpp>
+
+namespace godot {
+class Label;
+}
+
+using namespace godot;
+
+class nodes : public Node {
+	GDCLASS(nodes, Node);
+public:
+
+protected:
+	Label* _label_node = nullptr;
+	Node* _sprite_node = nullptr;
+	Node* _unique_node = nullptr;
+
+// lookups after _ready are cached too, typed by the variables holding them
+
+public:
+	void _ready() override;
+
+// lambdas can be called before _ready, so they don't use the fields
+	void _process(Variant delta) override;
+
+	Callable callback();
+
+	static void _bind_methods();
+};
+
+#endif // NODES_H
@@ -0,0 +1,22 @@
+
+#include "ready_less.hpp"
+
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+
+void ready_less::hide_child()
+{
+	_child_node->hide();
+}
+
+void ready_less::_ready()
+{
+	_child_node = get_node("Child");
+}
+
+void ready_less::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("hide_child"), &ready_less::hide_child);
+
+}
+
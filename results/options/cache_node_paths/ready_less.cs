@@ -0,0 +1,19 @@
+using Godot;
+using Godot.Collections;
+
+
+// _ready is created to assign the fields
+[GlobalClass]
+public partial class ready_less : Godot.Node
+{
+	protected Godot.Node _ChildNode;
+	public void HideChild()
+	{
+		_ChildNode.Hide();
+	}
+
+	public override void _Ready()
+	{
+		_ChildNode = GetNode("Child");
+	}
+}
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+#ifndef READY_LESS_H
+#define READY_LESS_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/classes/node.hpp>
+
+using namespace godot;
+
+// _ready is created to assign the fields
+class ready_less : public Node {
+	GDCLASS(ready_less, Node);
+public:
+
+protected:
+	Node* _child_node = nullptr;
+
+public:
+	void hide_child();
+	void _ready() override;
+
+	static void _bind_methods();
+};
+
+#endif // READY_LESS_H
@@ -0,0 +1,39 @@
+
+#include "folding.hpp"
+
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+
+double folding::folded(double delta)
+{
+	int seconds = 86400;
+	double angle = 7.853981633974483;
+	int truncated = -3;
+	int mixed = 13;
+	double scaled = delta * 0.016666666666666666;
+	seconds += 3;
+	return angle + seconds + truncated + mixed + scaled;
+}
+
+void folding::kept(int value)
+{
+	UtilityFunctions::print(value * 2 + 1, value * 3);
+}
+
+Vector2 folding::constructors(Vector2 velocity)
+{
+	static const Color COLOR_CONST0 = Color("#ff0000");
+	static const Vector2 VECTOR2_CONST1 = Vector2(0.5, 0.5);
+	Color tint = COLOR_CONST0;
+	UtilityFunctions::print(tint);
+	return velocity * VECTOR2_CONST1 + VECTOR2_CONST1;
+}
+
+void folding::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("folded", "delta"), &folding::folded);
+	ClassDB::bind_method(D_METHOD("kept", "value"), &folding::kept);
+	ClassDB::bind_method(D_METHOD("constructors", "velocity"), &folding::constructors);
+
+}
+
@@ -0,0 +1,37 @@
+using Godot;
+using Godot.Collections;
+
+[GlobalClass]
+public partial class folding : Godot.Node
+{
+	public double Folded(double delta)
+	{
+		var seconds = 86400;
+		var angle = 7.853981633974483;
+		var truncated = -3;
+		var mixed = 13;
+		var scaled = delta * 0.016666666666666666;
+		seconds += 3;
+		return angle + seconds + truncated + mixed + scaled;
+	}
+
+
+	// only constant operands are folded
+	public void Kept(int value)
+	{
+		GD.Print(value * 2 + 1, value * 3);
+	}
+
+
+	// value type constructors with constant params are built once
+	private static readonly Color COLOR_CONST0 = new Color("#ff0000");
+	private static readonly Vector2 VECTOR2_CONST1 = new Vector2(0.5, 0.5);
+	public Vector2 Constructors(Vector2 velocity)
+	{
+		var tint = COLOR_CONST0;
+		GD.Print(tint);
+		return velocity * VECTOR2_CONST1 + VECTOR2_CONST1;
+	}
+
+
+}
\ No newline at end of file
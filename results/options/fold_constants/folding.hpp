@@ -0,0 +1,27 @@
+
+#ifndef FOLDING_H
+#define FOLDING_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/classes/node.hpp>
+
+using namespace godot;
+
+class folding : public Node {
+	GDCLASS(folding, Node);
+public:
+
+// only constant operands are folded
+	double folded(double delta);
+
+// value type constructors with constant params are built once
+	void kept(int value);
+
+	Vector2 constructors(Vector2 velocity);
+
+	static void _bind_methods();
+};
+
+#endif // FOLDING_H
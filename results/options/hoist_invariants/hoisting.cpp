@@ -0,0 +1,40 @@
+
+#include "hoisting.hpp"
+
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+
+int hoisting::get_next_id()
+{
+	next_id += 1;
+	return next_id;
+}
+
+Array hoisting::ids(int n)
+{
+	Array out = Array();
+	for(int i=0, i_end=n; i<i_end; i+=1)
+	{
+		out.append(get_next_id());
+	}
+	return out;
+}
+
+void hoisting::wait(int deadline)
+{
+	auto time_singleton = Time::get_singleton();
+	auto engine_singleton = Engine::get_singleton();
+	while(time_singleton->get_ticks_msec() < deadline)
+	{
+		engine_singleton->set_time_scale(0.0);
+	}
+}
+
+void hoisting::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("get_next_id"), &hoisting::get_next_id);
+	ClassDB::bind_method(D_METHOD("ids", "n"), &hoisting::ids);
+	ClassDB::bind_method(D_METHOD("wait", "deadline"), &hoisting::wait);
+
+}
+
@@ -0,0 +1,32 @@
+
+#ifndef HOISTING_H
+#define HOISTING_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/classes/node.hpp>
+
+using namespace godot;
+
+class hoisting : public Node {
+	GDCLASS(hoisting, Node);
+public:
+
+protected:
+	int next_id = 0;
+
+// the getter changes a member : it stays in the loop
+
+public:
+	int get_next_id();
+
+// the singleton is looked up once, the time is read at each iteration
+	Array ids(int n);
+
+	void wait(int deadline);
+
+	static void _bind_methods();
+};
+
+#endif // HOISTING_H
@@ -0,0 +1,18 @@
+
+#ifndef GDSCRIPT2ALL_PCH_H
+#define GDSCRIPT2ALL_PCH_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+#include <godot_cpp/classes/character_body2d.hpp>
+#include <godot_cpp/classes/node2d.hpp>
+#include <godot_cpp/classes/timer.hpp>
+
+
+using namespace godot;
+
+#endif // GDSCRIPT2ALL_PCH_H
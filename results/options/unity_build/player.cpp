@@ -0,0 +1,26 @@
+
+#include "player.hpp"
+
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+
+#ifndef GD2A_SN_died
+#define GD2A_SN_died
+static const StringName &_sn_died() { static const StringName name("died"); return name; }
+#endif
+
+void Player::hit()
+{
+	health -= 1;
+	if(health <= 0)
+	{emit_signal(_sn_died());
+	}
+}
+
+void Player::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("hit"), &Player::hit);
+
+	ClassDB::add_signal(get_class_static(), MethodInfo("died"));
+}
+
@@ -0,0 +1,27 @@
+
+#ifndef PLAYER_H
+#define PLAYER_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/classes/character_body2d.hpp>
+
+using namespace godot;
+
+class Player : public CharacterBody2D {
+	GDCLASS(Player, CharacterBody2D);
+public:
+
+	/* signal died() */
+
+protected:
+	int health = 3;
+
+public:
+	void hit();
+
+	static void _bind_methods();
+};
+
+#endif // PLAYER_H
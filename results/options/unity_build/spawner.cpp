@@ -0,0 +1,34 @@
+
+#include "spawner.hpp"
+
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+#include <godot_cpp/classes/timer.hpp>
+
+#ifndef GD2A_SN_died
+#define GD2A_SN_died
+static const StringName &_sn_died() { static const StringName name("died"); return name; }
+#endif
+
+void spawner::_ready()
+{
+	add_child(timer);
+}
+
+void spawner::despawn()
+{
+	emit_signal(_sn_died());
+}
+
+spawner::spawner() :
+	timer(memnew(Timer))
+{
+}
+
+void spawner::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("despawn"), &spawner::despawn);
+
+	ClassDB::add_signal(get_class_static(), MethodInfo("died"));
+}
+
@@ -0,0 +1,35 @@
+
+#ifndef SPAWNER_H
+#define SPAWNER_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/classes/node2d.hpp>
+
+namespace godot {
+class Timer;
+}
+
+using namespace godot;
+
+class spawner : public Node2D {
+	GDCLASS(spawner, Node2D);
+public:
+	/* signal died() */
+
+protected:
+	Timer* timer;
+
+// both scripts use the "died" StringName, guarded in the unity build
+
+public:
+	void _ready() override;
+
+	void despawn();
+	spawner();
+
+	static void _bind_methods();
+};
+
+#endif // SPAWNER_H
@@ -0,0 +1,5 @@
+
+#include "pch.hpp"
+
+#include "player.cpp"
+#include "spawner.cpp"
@@ -0,0 +1,51 @@
+using Godot;
+using Godot.Collections;
+
+[GlobalClass]
+public partial class lists : Godot.Node
+{
+	public Array<int> Kept = new Array<int>{};
+
+	public int LocalOnly()
+	{
+		var ints = new System.Collections.Generic.List<int>{1, 2, };
+		ints.Add(3);
+		var total = ints.Count;
+		foreach(int i in ints)
+		{
+			total += i;
+		}
+		ints[0] = total;
+		return ints[0];
+	}
+
+
+	// arrays leaving the method stay godot arrays
+	public Array<String> Escaping()
+	{
+		var returned = new Array<String>{"a", };
+		var stored = new Array<int>{};
+		Kept = stored;
+		var passed = new Array<int>{1, };
+		GD.Print(passed);
+		return returned;
+	}
+
+
+	// a redeclared name stays a godot array
+	public void Redeclared(bool flag)
+	{
+		if(flag)
+		{
+			var values = new Array<int>{1, };
+			values.Clear();
+		}
+		else
+		{
+			var values = new Array<int>{2, };
+			values.Clear();
+		}
+	}
+
+
+}
\ No newline at end of file
@@ -0,0 +1,118 @@
+
+#include "packed.hpp"
+
+#include <godot_cpp/core/object.hpp>
+#include <godot_cpp/core/class_db.hpp>
+#include <godot_cpp/variant/utility_functions.hpp>
+
+void packed::add_to(Array a)
+{
+	a.append(1);
+}
+
+void packed::add_score()
+{
+	add_to(scores);
+}
+
+int packed::total(Array values)
+{
+	int sum = 0;
+	for(int value : values)
+	{
+		sum += value;
+	}
+	return sum;
+}
+
+Array packed::squares(int count)
+{
+	Array result = Array();
+	for(int i=0, i_end=count; i<i_end; i+=1)
+	{
+		result.append(i * i);
+	}
+	return result;
+}
+
+int packed::sum_of_squares(int count)
+{
+	PackedInt64Array values = PackedInt64Array();
+	for(int i=0, i_end=count; i<i_end; i+=1)
+	{
+		values.append(i * i);
+	}
+	int sum = 0;
+	for(int value : values)
+	{
+		sum += value;
+	}
+	return sum;
+}
+
+void packed::print_names()
+{
+	PackedStringArray names = []() {
+		static const PackedStringArray _literal = []() {
+			PackedStringArray _literal;
+			_literal.resize(2);
+			String *_items = _literal.ptrw();
+			_items[0] = "a";
+			_items[1] = "b";
+			return _literal;
+		}();
+		return _literal;
+	}();
+
+	// arrays of objects can't be packed
+	Array nodes = [&]() {
+		Array _literal;
+		_literal.resize(1);
+		_literal[0] = this;
+		return _literal;
+	}();
+	for(String name : names)
+	{
+		UtilityFunctions::print(name);
+	}
+	UtilityFunctions::print(nodes.size());
+}
+
+packed::packed() :
+	weights([]() {
+		static const Array _literal = []() {
+			Array _literal;
+			_literal.resize(2);
+			_literal[0] = 0.5;
+			_literal[1] = 1.5;
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}()),
+	scores([]() {
+		static const Array _literal = []() {
+			Array _literal;
+			_literal.resize(2);
+			_literal[0] = 1;
+			_literal[1] = 2;
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}())
+{
+}
+
+void packed::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("add_to", "a"), &packed::add_to);
+	ClassDB::bind_method(D_METHOD("add_score"), &packed::add_score);
+	ClassDB::bind_method(D_METHOD("total", "values"), &packed::total);
+	ClassDB::bind_method(D_METHOD("squares", "count"), &packed::squares);
+	ClassDB::bind_method(D_METHOD("sum_of_squares", "count"), &packed::sum_of_squares);
+	ClassDB::bind_method(D_METHOD("print_names"), &packed::print_names);
+	ClassDB::bind_method(D_METHOD("set_weights", "value"), &packed::set_weights);
+	ClassDB::bind_method(D_METHOD("get_weights"), &packed::get_weights);
+
+	ClassDB::add_property(get_class_static(), PropertyInfo(Variant::ARRAY, "weights"), "set_weights", "get_weights");
+	ClassDB::add_signal(get_class_static(), MethodInfo("totals_changed", PropertyInfo(Variant::ARRAY, "totals")));
+}
+
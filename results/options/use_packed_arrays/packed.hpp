@@ -0,0 +1,43 @@
+
+#ifndef PACKED_H
+#define PACKED_H
+
+#include <godot_cpp/godot.hpp>
+#include <godot_cpp/variant/array.hpp>
+#include <godot_cpp/variant/dictionary.hpp>
+#include <godot_cpp/classes/node.hpp>
+
+using namespace godot;
+
+// members, parameters and return values stay Array, they are shared by reference
+class packed : public Node {
+	GDCLASS(packed, Node);
+public:
+
+protected:
+	Array weights;
+	Array scores;
+
+	/* signal totals_changed(Array totals) */
+
+public:
+	void add_to(Array a);
+
+	void add_score();
+
+	int total(Array values);
+
+// arrays that stay in their method are packed
+	Array squares(int count);
+
+	int sum_of_squares(int count);
+
+	void print_names();
+	packed();
+	void set_weights(Array value) { weights = value; }
+	Array get_weights() { return weights; }
+
+	static void _bind_methods();
+};
+
+#endif // PACKED_H
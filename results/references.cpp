@@ -5,3 +5,15 @@
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
 
+references::references() :
+	reference(foo.bar),
+	function(foo()),
+	functionParams(foo(a, b)),
+	method(foo.bar()),
+	functionMethodParams(foo(a, b).bar(c, d)),
+	refMethod(foo.bar.baz()),
+	methodRef(foo.bar().baz),
+	subscription(this->dict[0])
+{
+}
+
@@ -15,14 +15,17 @@ public:
 
 protected:
 	Variant variable = foo;
-	Variant reference = foo.bar;
-	Variant function = foo();
-	Variant functionParams = foo(a, b);
-	Variant method = foo.bar();
-	Variant functionMethodParams = foo(a, b).bar(c, d);
-	Variant refMethod = foo.bar.baz();
-	Variant methodRef = foo.bar().baz;
-	Variant subscription = this->dict[0];
+	Variant reference;
+	Variant function;
+	Variant functionParams;
+	Variant method;
+	Variant functionMethodParams;
+	Variant refMethod;
+	Variant methodRef;
+	Variant subscription;
+
+public:
+	references();
 };
 
 #endif // REFERENCES_H
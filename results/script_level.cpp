@@ -5,58 +5,80 @@
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
 
-double script_level::get_get_var3()
-{return get_var3;
+double Overriding::method(double param)
+{
+	return param;
 }
 
-void script_level::set_get_var3(double value) {
-	get_var3 = value;
+void Overriding::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("method", "param"), &Overriding::method);
+
 }
 
- void script_level::set_DEF(double value)
+void Hooked::_hook()
 {
-	set_sprite_offset(value);
 }
 
-double script_level::get_DEF()
-{
-	return sprite_offset;
+void Hooked::run()
+{_hook();
 }
 
-void script_level::_ready()
-{
-	getset_var = 0.0;
+void Hooked::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("run"), &Hooked::run);
+
+}
+
+void HookedOverride::_hook()
+{UtilityFunctions::print("overridden");
+}
+
+void HookedOverride::_bind_methods() {
+
 }
 
-void script_level::set_export(Variant value) {
-	export = value;
+void script_level::dispatch(Variant hooked)
+{
+
+	// receivers typed by instantiation or cast call methods directly
+	HookedOverride* created = memnew(HookedOverride);
+	created->run();
+	(Object::cast_to<Hooked>(hooked))->run();
 }
 
-Variant script_level::get_export() {
-	return export;
+double script_level::get_get_var3()
+{return get_var3;
 }
 
-void script_level::set_export_param(Variant value) {
-	export_param = value;
+ void script_level::set_DEF(double value)
+{
+	set_sprite_offset(value);
 }
 
-Variant script_level::get_export_param() {
-	return export_param;
+double script_level::get_DEF()
+{
+	return sprite_offset;
 }
 
-void script_level::set_export_flags(Variant value) {
-	export_flags = value;
+void script_level::set_renamed(int value)
+{
+	renamed = value;
+	renamed += 1;
+	other->set_renamed(renamed);
 }
 
-Variant script_level::get_export_flags() {
-	return export_flags;
+void script_level::_ready()
+{
+	getset_var = 0.0;
 }
 
 void script_level::_bind_methods() {
+	ClassDB::bind_method(D_METHOD("dispatch", "hooked"), &script_level::dispatch);
 	ClassDB::bind_method(D_METHOD("get_get_var3"), &script_level::get_get_var3);
 	ClassDB::bind_method(D_METHOD("set_get_var3", "value"), &script_level::set_get_var3);
 	ClassDB::bind_method(D_METHOD("set_DEF", "value"), &script_level::set_DEF);
 	ClassDB::bind_method(D_METHOD("get_DEF"), &script_level::get_DEF);
+	ClassDB::bind_method(D_METHOD("set_renamed", "value"), &script_level::set_renamed);
+	ClassDB::bind_method(D_METHOD("get_renamed"), &script_level::get_renamed);
 	ClassDB::bind_method(D_METHOD("set_export", "value"), &script_level::set_export);
 	ClassDB::bind_method(D_METHOD("get_export"), &script_level::get_export);
 	ClassDB::bind_method(D_METHOD("set_export_param", "value"), &script_level::set_export_param);
@@ -4,11 +4,48 @@ using Godot.Collections;
 [GlobalClass]
 public partial class script_level : Godot.Node
 {
-	public partial class Nested1 : Godot.test
+	public partial class Nested1 : test
 	{
 
 	}
 
+	public partial class Overriding : test
+	{
+
+		public override double Method(double param = 5.0)
+		{
+			return param;
+		}
+	}
+
+	public partial class Hooked : Godot.Object
+	{
+
+		public virtual void _Hook()
+		{
+		}
+		public void Run()
+		{_Hook();
+		}
+	}
+
+	public partial class HookedOverride : Hooked
+	{
+
+		public override void _Hook()
+		{GD.Print("overridden");
+		}
+	}
+
+	public void Dispatch(Godot.Variant hooked)
+	{
+
+		// receivers typed by instantiation or cast call methods directly
+		var created = new HookedOverride();
+		created.Run();
+		(hooked.As<Hooked>()).Run();
+	}
+
 	public partial class Nested4 : Godot.Object
 	{
 
@@ -25,8 +62,8 @@ public partial class script_level : Godot.Node
 
 
 	public enum Enum0 {UNIT_NEUTRAL, UNIT_ENEMY, UNIT_ALLY}
-	public enum Named {THING_1, THING_2, ANOTHER_THING =  - 1}
-	public enum WithEndlines {THING_1, THING_2}
+	public enum Named {Thing1, Thing2, AnotherThing =  - 1}
+	public enum WithEndlines {Thing1, Thing2}
 
 	[Export]
 	public Godot.Variant Export;
@@ -81,6 +118,21 @@ public partial class script_level : Godot.Node
 	[Signal]
 	public delegate void BEventHandler(int c, Type d);
 
+	public script_level Other;
+
+	public int Renamed
+	{
+		set
+		{
+			_Renamed = value;
+			_Renamed += 1;
+			Other.Renamed = _Renamed;
+		}
+		get { return _Renamed; }
+	}
+	private int _Renamed = 0;
+
+
 	public override void _Ready()
 	{
 		GetsetVar = 0.0;
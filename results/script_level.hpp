@@ -16,6 +16,35 @@ class Nested1 : public test {
 public:
 };
 
+class Overriding : public test {
+	GDCLASS(Overriding, test);
+public:
+
+	double method(double param = 5.0) override;
+
+	static void _bind_methods();
+};
+
+class Hooked : public Object {
+	GDCLASS(Hooked, Object);
+public:
+
+	virtual void _hook();
+
+	void run();
+
+	static void _bind_methods();
+};
+
+class HookedOverride : public Hooked {
+	GDCLASS(HookedOverride, Hooked);
+public:
+
+	void _hook() override;
+
+	static void _bind_methods();
+};
+
 class Nested2 : public Object {
 	GDCLASS(Nested2, Object);
 public:
@@ -36,6 +65,7 @@ class script_level : public Node {
 	GDCLASS(script_level, Node);
 public:
 
+	void dispatch(Variant hooked);
 	enum  {UNIT_NEUTRAL, UNIT_ENEMY, UNIT_ALLY};
 	enum Named {THING_1, THING_2, ANOTHER_THING =  - 1};
 	enum WithEndlines {THING_1, THING_2};
@@ -51,7 +81,7 @@ protected:
 
 public:
 	double get_get_var3();
-	void set_get_var3(double value);
+	void set_get_var3(double value) { get_var3 = value; }
 
 protected:
 	double getset_var;
@@ -65,13 +95,21 @@ public:
 	/* signal a() */
 	/* signal b(int c, Ref<Type> d) */
 
+protected:
+	script_level* other = nullptr;
+
+	int renamed = 0;
+
+public:
+	void set_renamed(int value);
+	int get_renamed() { return renamed; }
 	void _ready() override;
-	void set_export(Variant value);
-	Variant get_export();
-	void set_export_param(Variant value);
-	Variant get_export_param();
-	void set_export_flags(Variant value);
-	Variant get_export_flags();
+	void set_export(Variant value) { export = value; }
+	Variant get_export() { return export; }
+	void set_export_param(Variant value) { export_param = value; }
+	Variant get_export_param() { return export_param; }
+	void set_export_flags(Variant value) { export_flags = value; }
+	Variant get_export_flags() { return export_flags; }
 
 	static void _bind_methods();
 };
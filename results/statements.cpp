@@ -5,6 +5,8 @@
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
 
+static const StringName &_sn_process_frame() { static const StringName name("process_frame"); return name; }
+
 Array statements::method()
 {
 
@@ -36,11 +38,26 @@ Array statements::method()
 		continue;
 	}
 
-	for(int j=0; j<i; j+=1)
+	for(int j=0, j_end=i; j<j_end; j+=1)
 	{
 		i += j;
 	}
 
+	for(int k=2, k_end=i; k>k_end; k-=1)
+	{
+		i += k;
+	}
+
+	for(double k=i, k_step=i; (k_step>0 ? k<10 : k>10); k+=k_step)
+	{
+		i += k;
+	}
+
+	for(int n=0, n_end=count; n<n_end; n+=1)
+	{
+		count += n;
+	}
+
 	for(Variant j : array)
 	{
 		i += j;
@@ -78,19 +95,58 @@ Array statements::method()
 			break; }
 	}
 
+	switch(current_state)
+	{
+		case State::IDLE:
+		{
+			UtilityFunctions::print("idle");
+			break; }
+		case State::RUN:
+		{
+			UtilityFunctions::print("run");
+			break; }
+	}
+
+	{
+		auto _match2 = get_parent()->get_name();
+		if(_match2 == "root")
+		{
+			UtilityFunctions::print("root");
+		}
+		else 
+		{
+			{
+				auto _match4 = get_child(0)->get_name();
+				if(_match4 == "first")
+				{
+					UtilityFunctions::print("first child");
+				}
+			}
+			UtilityFunctions::print("child");
+		}
+	}
+
+	{
+		auto _match2 = get_parent()->get_name();
+		{
+			UtilityFunctions::print("any");
+		}
+	}
+
 	i += 3 / 3 + 2 * 0.5;
 
 	/* await this->jump; */ // no equivalent to await in c++ !
 	/* await this->get_tree()->process_frame; */ // no equivalent to await in c++ !
 
-	get_tree()->emit_signal("process_frame", 0.7);
-	get_tree()->connect("process_frame", something);
+	get_tree()->emit_signal(_sn_process_frame(), 0.7);
+	get_tree()->connect(_sn_process_frame(), something);
 
 	return Array();
 }
 
 void statements::_bind_methods() {
 	ClassDB::bind_method(D_METHOD("method"), &statements::method);
-
+	ClassDB::bind_integer_constant(get_class_static(), _gde_constant_get_enum_name(IDLE, "IDLE"), "IDLE", IDLE);
+	ClassDB::bind_integer_constant(get_class_static(), _gde_constant_get_enum_name(RUN, "RUN"), "RUN", RUN);
 }
 
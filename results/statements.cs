@@ -1,11 +1,15 @@
 using Godot;
 using Godot.Collections;
 
-
-// method to test statements
 [GlobalClass]
 public partial class statements : Godot.Node
 {
+	public enum State {Idle, Run}
+	public statements.State CurrentState = State.Idle;
+	public int Count = 3;
+
+
+	// method to test statements
 	public Array Method()
 	{
 
@@ -38,11 +42,26 @@ public partial class statements : Godot.Node
 			continue;
 		}
 
-		foreach(int j in GD.Range(i))
+		for(int j = 0, j_end = i; j < j_end; j += 1)
 		{
 			i += j;
 		}
 
+		for(int k = 2, k_end = i; k > k_end; k -= 1)
+		{
+			i += k;
+		}
+
+		for(double k = i, k_step = i; (k_step > 0 ? k < 10 : k > 10); k += k_step)
+		{
+			i += k;
+		}
+
+		for(int n = 0, n_end = Count; n < n_end; n += 1)
+		{
+			Count += n;
+		}
+
 		foreach(Variant j in array)
 		{
 			i += j;
@@ -80,12 +99,50 @@ public partial class statements : Godot.Node
 				break; }
 		}
 
+		switch(CurrentState)
+		{
+			case State.Idle:
+			{
+				GD.Print("idle");
+				break; }
+			case State.Run:
+			{
+				GD.Print("run");
+				break; }
+		}
+
+		{
+			var _match3 = GetParent().Name;
+			if(_match3 == "root")
+			{
+				GD.Print("root");
+			}
+			else 
+			{
+				{
+					var _match5 = GetChild(0).Name;
+					if(_match5 == "first")
+					{
+						GD.Print("first child");
+					}
+				}
+				GD.Print("child");
+			}
+		}
+
+		{
+			var _match3 = GetParent().Name;
+			{
+				GD.Print("any");
+			}
+		}
+
 		i += 3 / 3 + 2 * 0.5;
 
 		await ToSignal(this, "Jump");
-		await ToSignal(GetTree(), "ProcessFrame");
+		await ToSignal(GetTree(), SceneTree.SignalName.ProcessFrame);
 
-		GetTree().EmitSignal("ProcessFrame", 0.7);
+		GetTree().EmitSignal(SceneTree.SignalName.ProcessFrame, 0.7);
 		GetTree().ProcessFrame += something;
 
 		return new Array{};
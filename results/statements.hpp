@@ -9,14 +9,23 @@
 
 using namespace godot;
 
-// method to test statements
 class statements : public Node {
 	GDCLASS(statements, Node);
 public:
+	enum State {IDLE, RUN};
+
+protected:
+	statements::State current_state = State::IDLE;
+	int count = 3;
+
+// method to test statements
 
+public:
 	Array method();
 
 	static void _bind_methods();
 };
 
+VARIANT_ENUM_CAST(statements::State)
+
 #endif // STATEMENTS_H
@@ -4,6 +4,11 @@
 #include <godot_cpp/core/object.hpp>
 #include <godot_cpp/core/class_db.hpp>
 #include <godot_cpp/variant/utility_functions.hpp>
+#include <godot_cpp/classes/sprite2d.hpp>
+
+static const StringName &_sn_process_frame() { static const StringName name("process_frame"); return name; }
+static const StringName &_sn_jump() { static const StringName name("jump"); return name; }
+static const StringName &_sn_movement() { static const StringName name("movement"); return name; }
 
 double test::method(double param)
 {
@@ -14,14 +19,14 @@ double test::method(double param)
 	return val * param;
 }
 
-void test::set_sprite(Ref<Sprite2D> value)
+void test::set_sprite(Sprite2D* value)
 {
 	sprite = value;
 	sprite->set_position(Vector2(1, 2));
 	sprite->set_position( /* get_position() */ + Vector2(1, 2));
 }
 
-Ref<Sprite2D> test::get_sprite()
+Sprite2D* test::get_sprite()
 {
 	return sprite;
 }
@@ -31,16 +36,16 @@ void test::async_function()
 	/* await this->jump; */ // no equivalent to await in c++ !
 	/* await this->get_tree()->process_frame; */ // no equivalent to await in c++ !
 
-	get_tree()->emit_signal("process_frame", 0.7);
+	get_tree()->emit_signal(_sn_process_frame(), 0.7);
 
 	Callable myLambda = []() 
 	{	UtilityFunctions::print("look ma i'm jumping");
 	};
 
 	// lambdas are not perfectly translated
-	connect("jump", myLambda);
+	connect(_sn_jump(), myLambda);
 
-	emit_signal("movement", Vector3::UP, 0.1);
+	emit_signal(_sn_movement(), Vector3::UP, 0.1);
 }
 
 void test::_ready()
@@ -48,20 +53,47 @@ void test::_ready()
 	k = 42;
 }
 
-void test::set_export(Variant value) {
-	export = value;
-}
-
-Variant test::get_export() {
-	return export;
-}
-
-void test::set_export_flags(int value) {
-	export_flags = value;
-}
-
-int test::get_export_flags() {
-	return export_flags;
+test::test() :
+	array([]() {
+		static const Array _literal = []() {
+			Array _literal;
+			_literal.resize(3);
+			_literal[0] = 0;
+			_literal[1] = 1;
+			_literal[2] = 2;
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}()),
+	has_call(array.has(3)),
+	dict([]() {
+		static const Dictionary _literal = []() {
+			Dictionary _literal;
+			_literal[0] = 1;
+			_literal[1] = 2;
+			_literal[2] = 3;
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}()),
+	string_array([]() {
+		static const Array _literal = []() {
+			Array _literal;
+			_literal.resize(2);
+			_literal[0] = "0";
+			_literal[1] = "1";
+			return _literal;
+		}();
+		return _literal.duplicate();
+	}()),
+	x(this->get_parent()),
+	aClass(ProjectSettings::get_singleton()->get_global_class_list()[10]),
+	get_node(get_node("node")),
+	get_node2(get_node("../node")),
+	get_unique_node(get_node("%unique_node")),
+	preload_resource(/* preload has no equivalent, add a 'ResourcePreloader' Node in your scene */("res://path")),
+	load_resource(load("res://path"))
+{
 }
 
 void test::_bind_methods() {
@@ -86,3 +118,4 @@ void test::_bind_methods() {
 	ClassDB::add_signal(get_class_static(), MethodInfo("movement", PropertyInfo(Variant::VECTOR3, "dir"), PropertyInfo(Variant::FLOAT, "speed")));
 }
 
+int test::i = 0;
@@ -12,13 +12,13 @@ using Godot.Collections;
 public partial class test : Godot.Node
 {
 	[Tool]
-	public partial class Nested1 : Godot.test
+	public partial class Nested1 : test
 	{
 
 	}
 
 	public enum Enum0 {UNIT_NEUTRAL, UNIT_ENEMY, UNIT_ALLY}
-	public enum NamedEnum {THING_1, THING_2, ANOTHER_THING =  - 1}
+	public enum NamedEnum {Thing1, Thing2, AnotherThing =  - 1}
 
 	[Export]
 	public Godot.Variant Export;
@@ -37,12 +37,12 @@ public partial class test : Godot.Node
 	public Array Array = new Array{0, 1, 2, };
 	public bool HasCall = Array.Contains(3);
 	public Dictionary Dict = new Dictionary{{0, 1},{1, 2},{2, 3},};
-	public Array<string> StringArray = new Array{"0", "1", };
+	public Array<string> StringArray = new Array<string>{"0", "1", };
 
 
 	// type inference
 	public int J = I;
-	public double Method(double param = 5.0)
+	public virtual double Method(double param = 5.0)
 	{
 		foreach(string k in StringArray)
 		{
@@ -88,22 +88,24 @@ public partial class test : Godot.Node
 	[Signal]
 	public delegate void MovementEventHandler(Vector3 dir, double speed);
 
+	private static readonly System.Action _Lambda0 = () =>
+	{	GD.Print("look ma i'm jumping");
+	};
+
 	public void AsyncFunction()
 	{
-		await ToSignal(this, "Jump");
-		await ToSignal(GetTree(), "ProcessFrame");
+		await ToSignal(this, SignalName.Jump);
+		await ToSignal(GetTree(), SceneTree.SignalName.ProcessFrame);
 
-		GetTree().EmitSignal("ProcessFrame", 0.7);
+		GetTree().EmitSignal(SceneTree.SignalName.ProcessFrame, 0.7);
 
-		var myLambda = () =>
-		{	GD.Print("look ma i'm jumping");
-		};
+		var myLambda = _Lambda0;
 
 
 		// lambdas are not perfectly translated
 		Jump += myLambda;
 
-		EmitSignal("Movement", Vector3.Up, 0.1);
+		EmitSignal(SignalName.Movement, Vector3.Up, 0.1);
 	}
 
 
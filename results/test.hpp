@@ -7,8 +7,10 @@
 #include <godot_cpp/variant/dictionary.hpp>
 #include <godot_cpp/classes/node.hpp>
 #include <godot_cpp/classes/resource.hpp>
-#include <godot_cpp/classes/sprite2d.hpp>
-#include <godot_cpp/classes/test.hpp>
+
+namespace godot {
+class Sprite2D;
+}
 
 using namespace godot;
 
@@ -39,10 +41,10 @@ protected:
 	const String STRING_CONSTANT = "the fox said \"get off my lawn\"";
 	String big_str = "\
 	this is a multiline string ";
-	Array array = Array {/* initializer lists are unsupported */ 0, 1, 2,  };
-	bool has_call = array.has(3);
-	Dictionary dict = Dictionary {/* initializer lists are unsupported */ {0, 1},{1, 2},{2, 3}, };
-	Array string_array = Array {/* initializer lists are unsupported */ "0", "1",  };
+	Array array;
+	bool has_call;
+	Dictionary dict;
+	Array string_array;
 
 // type inference
 	int j = i;
@@ -50,28 +52,28 @@ protected:
 // determine type based on godot doc
 
 public:
-	double method(double param = 5.0);
+	virtual double method(double param = 5.0);
 
 protected:
-	Ref<Node> x = this->get_parent();
-	Dictionary aClass = ProjectSettings::get_singleton()->get_global_class_list()[10];
+	Node* x;
+	Dictionary aClass;
 	const RenderingServer::ShaderMode enum = RenderingServer::ShaderMode::SHADER_SPATIAL;
 
 // Gdscript special syntax
-	Ref<Node> get_node = get_node("node");
-	Ref<Node> get_node2 = get_node("../node");
-	Ref<Node> get_unique_node = get_node("%unique_node");
-	Ref<Resource> preload_resource = /* preload has no equivalent, add a 'ResourcePreloader' Node in your scene */("res://path");
-	Ref<Resource> load_resource = load("res://path");
+	Node* get_node;
+	Node* get_node2;
+	Node* get_unique_node;
+	Ref<Resource> preload_resource;
+	Ref<Resource> load_resource;
 
-	Ref<Sprite2D> sprite;
+	Sprite2D* sprite = nullptr;
 // cpp will need help here
 
 public:
-	void set_sprite(Ref<Sprite2D> value);
+	void set_sprite(Sprite2D* value);
 
 // signals
-	Ref<Sprite2D> get_sprite();
+	Sprite2D* get_sprite();
 	/* signal jump() */
 	/* signal movement(Vector3 dir, double speed) */
 
@@ -83,10 +85,11 @@ protected:
 
 public:
 	void _ready() override;
-	void set_export(Variant value);
-	Variant get_export();
-	void set_export_flags(int value);
-	int get_export_flags();
+	test();
+	void set_export(Variant value) { export = value; }
+	Variant get_export() { return export; }
+	void set_export_flags(int value) { export_flags = value; }
+	int get_export_flags() { return export_flags; }
 
 	static void _bind_methods();
 };
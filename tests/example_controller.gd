@@ -77,6 +77,19 @@ func _process(delta : float):
 	for i in range(get_slide_collision_count()):
 		collision.emit(get_slide_collision(i))
 
+func steepest_slope(normals : Array[Vector3]) -> float:
+	var steepest := 0.0
+	for normal in normals:
+		var slope := normal.angle_to(get_floor_normal()) * Engine.time_scale
+		steepest = maxf(steepest, slope)
+	return steepest
+
+func pressed_actions(actions : Array[String]) -> int:
+	var pressed := 0
+	for action in actions:
+		if Input.is_action_pressed(action): pressed += 1
+	return pressed
+
 
 """ movement state / animations """
 
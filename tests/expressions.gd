@@ -46,4 +46,11 @@ var multiline = (
 		and (
 			not buffer_size or (_terminal_buffer[-1] != _terminal_pad)
 		) # and a comment
-	)
\ No newline at end of file
+	)
+# string formatting
+var formatted = "%s: %d" % [str, byte]
+var formatted_single = "{%5.2f%%}" % 0.5
+var formatted_padded = "%-8s|%04d|%x" % ["name", 7, 255] + "!"
+var formatted_array = "%s %s" % string_array
+var formatted_signed = "%+d|%+05d|%+.1f" % [byte, byte, 0.5]
+var formatted_dynamic = "%*d" % [4, byte]
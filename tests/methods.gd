@@ -23,4 +23,43 @@ func declare():
 	
 func return_inference(param = 5.):
 	var val = 2
-	return val * param
\ No newline at end of file
+	return val * param
+
+func typed_collections() -> int:
+	var ints: Array[int] = [1, 2]
+	ints.append(3)
+	return ints.size()
+
+func lambdas(offset : int):
+	var doubled = func(x : int): return x * 2
+	var shifted = func(x : int): return x + offset
+	var callback = func(): returning(1.)
+	var untyped = func(a): return a * 2
+	# lambda params don't change the type of outer locals
+	var x := "s"
+	var same_x = func(x : int): return x
+	var y = x
+	return [doubled, shifted, callback, untyped, same_x, y]
+
+func narrowing(flag : bool):
+	var count
+	count = 0
+	if flag: count += 1
+	var mixed
+	mixed = 1
+	mixed = "one"
+	return count
+
+func narrowing_scopes(flag : bool):
+	if flag:
+		var y
+		y = 1
+	else:
+		var y
+		y = "s"
+	var read_first
+	print(read_first)
+	read_first = 1
+	var assigned_in_branch
+	if flag: assigned_in_branch = 1
+	return assigned_in_branch
@@ -2,6 +2,23 @@ class_name script_level extends Node
 
 class Nested1 extends test: pass
 
+class Overriding extends test:
+	func method(param = 5.):
+		return param
+
+class Hooked:
+	func _hook(): pass
+	func run(): _hook()
+
+class HookedOverride extends Hooked:
+	func _hook(): print("overridden")
+
+func dispatch(hooked):
+	# receivers typed by instantiation or cast call methods directly
+	var created = HookedOverride.new()
+	created.run()
+	(hooked as Hooked).run()
+
 class Nested4:
 	class Nested2: pass
 
@@ -44,3 +61,11 @@ var DEF = -0.1: # comment
 
 signal a()
 signal b(c:int,d:Type)
+
+var other : script_level
+
+var renamed := 0 :
+	set(value):
+		renamed = value
+		self.renamed += 1
+		other.renamed = renamed
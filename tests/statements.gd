@@ -1,5 +1,9 @@
 extends Node
 
+enum State { IDLE, RUN }
+var current_state := State.IDLE
+var count := 3
+
 # method to test statements
 func method():
 	
@@ -25,6 +29,15 @@ func method():
 	for j in range(i):
 		i += j
 
+	for k in range(2, i, -1):
+		i += k
+
+	for k: float in range(i, 10, i):
+		i += k
+
+	for n in range(count):
+		count += n
+
 	for j in array:
 		i += j
 
@@ -47,6 +60,27 @@ func method():
 		_:
 			print("unknown")
 	
+	match current_state:
+		State.IDLE:
+			print("idle")
+		State.RUN:
+			print("run")
+	
+	match get_parent().name:
+		"root":
+			print("root")
+		_:
+			match get_child(0).name:
+				"first":
+					print("first child")
+			print("child")
+	
+	match get_parent().name:
+		_:
+			print("any")
+		"root":
+			print("unreachable")
+	
 	i += 3/3 + 2*.5
 	
 	await jump